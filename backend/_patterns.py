@@ -0,0 +1,157 @@
+"""
+Shared precompiled regex patterns for the rule-based parsers
+Used by ai_features.py and resume_parser.py so the hot parsing paths
+never recompile (or re-lookup) patterns per call
+"""
+
+import re
+
+try:
+    import ahocorasick  # pyahocorasick - optional, faster multi-string search
+except ImportError:
+    ahocorasick = None
+
+# Common programming languages and technologies
+TECH_KEYWORDS = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue',
+    'Node.js', 'Django', 'Flask', 'FastAPI', 'Spring', 'AWS', 'Azure', 'GCP',
+    'Docker', 'Kubernetes', 'MongoDB', 'PostgreSQL', 'MySQL', 'Redis',
+    'Git', 'CI/CD', 'REST API', 'GraphQL', 'Machine Learning', 'AI',
+    'TensorFlow', 'PyTorch', 'Pandas', 'NumPy', 'SQL', 'NoSQL',
+    'Microservices', 'Agile', 'Scrum', 'HTML', 'CSS', 'Tailwind',
+    'Bootstrap', 'Material-UI', 'Redux', 'Next.js', 'Express.js',
+    'C++', 'C#', 'Go', 'Rust', 'Swift', 'Kotlin', 'Ruby', 'PHP', 'Scala'
+]
+
+# Single alternation so one pass over the text finds every keyword;
+# longest-first ordering keeps e.g. 'JavaScript' from losing to 'Java'
+TECH_ALT_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(t) for t in sorted(TECH_KEYWORDS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE,
+)
+
+# Map case-insensitive matches back to the canonical keyword spelling
+TECH_CANONICAL = {tech.lower(): tech for tech in TECH_KEYWORDS}
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+def _build_automaton(words_by_value):
+    automaton = ahocorasick.Automaton()
+    for word, value in words_by_value:
+        automaton.add_word(word.lower(), value)
+    automaton.make_automaton()
+    return automaton
+
+
+def _iter_word_matches(automaton, text: str):
+    """Yield automaton values whose matches satisfy the regex \\b checks"""
+    lowered = text.lower()
+    last = len(lowered) - 1
+    for end, (length, value) in automaton.iter(lowered):
+        start = end - length + 1
+        if start > 0 and _is_word_char(lowered[start - 1]) and _is_word_char(lowered[start]):
+            continue
+        if end < last and _is_word_char(lowered[end]) and _is_word_char(lowered[end + 1]):
+            continue
+        yield value
+
+
+_TECH_AUTOMATON = (
+    _build_automaton((tech, (len(tech), tech)) for tech in TECH_KEYWORDS)
+    if ahocorasick else None
+)
+
+
+def match_tech_keywords(text: str) -> list:
+    """Find all tech keywords in text in a single linear pass.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed,
+    otherwise falls back to the compiled alternation regex.
+    """
+    if _TECH_AUTOMATON is None:
+        return [TECH_CANONICAL[m.lower()] for m in TECH_ALT_RE.findall(text)]
+    return list(_iter_word_matches(_TECH_AUTOMATON, text))
+
+
+# Education keywords; the per-keyword context pattern
+# (50 chars either side) only runs for keywords present
+EDU_KEYWORDS = ["Bachelor", "Master", "PhD", "BS", "MS", "MBA", "degree"]
+
+EDU_CONTEXT_RES = {
+    keyword.lower(): re.compile(r'(.{0,50}' + keyword + r'.{0,50})', re.IGNORECASE)
+    for keyword in EDU_KEYWORDS
+}
+
+EDU_CANONICAL = {keyword.lower(): keyword for keyword in EDU_KEYWORDS}
+
+BENEFIT_KEYWORDS = ["health insurance", "401k", "dental", "vision", "pto", "paid time off",
+                    "remote", "hybrid", "flexible hours", "stock options", "bonus"]
+
+
+def _category_alternation(keywords, escape=True):
+    words = sorted(keywords, key=len, reverse=True)
+    return '|'.join(re.escape(w) if escape else w for w in words)
+
+
+# One master pattern covering every literal keyword category, so a job
+# description is traversed once regardless of how many categories exist
+MASTER_KEYWORD_RE = re.compile(
+    r'\b(?:(?P<tech>' + _category_alternation(TECH_KEYWORDS)
+    + r')|(?P<edu>' + _category_alternation(EDU_KEYWORDS, escape=False)
+    + r')|(?P<benefit>' + _category_alternation(BENEFIT_KEYWORDS)
+    + r'))\b',
+    re.IGNORECASE,
+)
+
+_MASTER_AUTOMATON = (
+    _build_automaton(
+        [(tech, (len(tech), ('tech', tech))) for tech in TECH_KEYWORDS]
+        + [(edu, (len(edu), ('edu', edu))) for edu in EDU_KEYWORDS]
+        + [(benefit, (len(benefit), ('benefit', benefit))) for benefit in BENEFIT_KEYWORDS]
+    )
+    if ahocorasick else None
+)
+
+
+def scan_keywords(text: str) -> dict:
+    """Find tech, education and benefit keywords in one pass over text"""
+    found = {'tech': [], 'edu': [], 'benefit': []}
+    if _MASTER_AUTOMATON is not None:
+        for category, keyword in _iter_word_matches(_MASTER_AUTOMATON, text):
+            found[category].append(keyword)
+        return found
+    for m in MASTER_KEYWORD_RE.finditer(text):
+        category = m.lastgroup
+        keyword = m.group(category).lower()
+        if category == 'tech':
+            found['tech'].append(TECH_CANONICAL[keyword])
+        elif category == 'edu':
+            found['edu'].append(EDU_CANONICAL[keyword])
+        else:
+            found['benefit'].append(keyword)
+    return found
+
+# Years of experience ("5+ years of experience", "experience: 3 yrs")
+EXP_RES = [
+    re.compile(r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+experience', re.IGNORECASE),
+    re.compile(r'experience:\s*(\d+)\+?\s*(?:years?|yrs?)', re.IGNORECASE),
+]
+
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+PHONE_RE = re.compile(r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
+URL_RE = re.compile(r'https?://[^\s<>"]+')
+
+SALARY_RES = [
+    re.compile(r'\$\s*(\d{1,3}(?:,\d{3})*(?:k|K)?(?:\s*-\s*\$?\s*\d{1,3}(?:,\d{3})*(?:k|K)?)?)'),
+    re.compile(r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*(?:USD|dollars)'),
+]
+
+SUMMARY_RE = re.compile(
+    r'(?:SUMMARY|PROFESSIONAL SUMMARY|ABOUT|PROFILE|OBJECTIVE)[\s:]+(.+?)(?=\n\n|\n[A-Z]{3,})',
+    re.IGNORECASE | re.DOTALL,
+)
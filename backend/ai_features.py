@@ -6,23 +6,95 @@ AI-powered features for CareerFlow
 - Embeddings for knowledge search
 """
 
+import os
 import re
+import tempfile
+import threading
 from typing import List, Dict, Optional
-from sentence_transformers import SentenceTransformer
 import numpy as np
 
-# Initialize embedding model (lightweight)
+from _patterns import (
+    scan_keywords,
+    EDU_CONTEXT_RES,
+    EXP_RES,
+    URL_RE,
+    SALARY_RES,
+)
+
+# Patterns specific to job description / email parsing, compiled once at import
+_REQ_RES = [
+    re.compile(r'(?:^|\n)\s*[•\-\*]\s*(.+?)(?=\n|$)', re.MULTILINE),
+    re.compile(r'(?:^|\n)\s*\d+\.\s*(.+?)(?=\n|$)', re.MULTILINE),
+]
+
+_COMPANY_RES = [
+    re.compile(r'(?:at|with|for)\s+([A-Z][A-Za-z0-9\s&]+?)(?:\s+(?:is|has|invites))'),
+    re.compile(r'(?:join|work for|career at)\s+([A-Z][A-Za-z0-9\s&]+)'),
+]
+
+_LOCATION_RE = re.compile(r'(?:in|at|location:|based in)\s+([A-Z][a-z]+(?:,\s*[A-Z]{2})?)')
+
+# Common job titles, matched case-insensitively against the email body
+_TITLE_KEYWORDS = [
+    "Software Engineer", "Senior Engineer", "Full Stack", "Frontend", "Backend",
+    "Data Scientist", "Product Manager", "DevOps", "Engineering Manager"
+]
+_TITLE_KEYWORDS_LOWER = [(title, title.lower()) for title in _TITLE_KEYWORDS]
+
+# Initialize embedding model (lightweight, loaded lazily)
 embedding_model = None
+_embedding_model_lock = threading.Lock()
+
+def _load_embedding_model():
+    # Imported here so the heavy torch/transformers stack is only pulled in
+    # when embeddings are actually needed (or preloaded in the background)
+    from sentence_transformers import SentenceTransformer
+
+    # Prefer the dynamically INT8-quantized ONNX export when onnxruntime is
+    # installed - 2-3x faster on CPU with near-identical similarity scores
+    try:
+        import onnxruntime  # noqa: F401
+        return SentenceTransformer(
+            'all-MiniLM-L6-v2',
+            backend='onnx',
+            model_kwargs={'file_name': 'onnx/model_quint8_avx2.onnx'},
+        )
+    except Exception as e:
+        print(f"ONNX embedding backend unavailable ({e}), using default")
+    return SentenceTransformer('all-MiniLM-L6-v2')
 
 def get_embedding_model():
     global embedding_model
     if embedding_model is None:
-        try:
-            embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-        except Exception as e:
-            print(f"Error loading embedding model: {e}")
+        with _embedding_model_lock:
+            if embedding_model is None:
+                try:
+                    embedding_model = _load_embedding_model()
+                except Exception as e:
+                    print(f"Error loading embedding model: {e}")
     return embedding_model
 
+def preload_embedding_model():
+    """Load and warm up the embedding model in a background thread.
+
+    Called at server startup so the first real search doesn't pay the
+    model download/load plus first-inference (JIT/kernel) cost.
+    """
+    def _warmup():
+        model = get_embedding_model()
+        if model is not None:
+            try:
+                model.encode(["warmup"], convert_to_numpy=True)
+            except Exception as e:
+                print(f"Embedding model warmup failed: {e}")
+            try:
+                if os.path.exists(_INDEX_SNAPSHOT):
+                    _knowledge_index.load(_INDEX_SNAPSHOT)
+            except Exception as e:
+                print(f"Knowledge index snapshot load failed: {e}")
+
+    threading.Thread(target=_warmup, name="embedding-warmup", daemon=True).start()
+
 def parse_job_description(description: str) -> Dict:
     """
     Parse job description to extract key information using regex and NLP
@@ -38,56 +110,34 @@ def parse_job_description(description: str) -> Dict:
     }
     
     # Extract years of experience
-    exp_match = re.search(r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+experience', description, re.IGNORECASE)
+    exp_match = EXP_RES[0].search(description)
     if exp_match:
         result["experience_years"] = int(exp_match.group(1))
-    
+
+    # One pass over the description finds every literal keyword category
+    keywords = scan_keywords(description)
+
     # Common programming languages and technologies
-    tech_keywords = [
-        'Python', 'Java', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue',
-        'Node.js', 'Django', 'Flask', 'FastAPI', 'Spring', 'AWS', 'Azure', 'GCP',
-        'Docker', 'Kubernetes', 'MongoDB', 'PostgreSQL', 'MySQL', 'Redis',
-        'Git', 'CI/CD', 'REST API', 'GraphQL', 'Machine Learning', 'AI',
-        'TensorFlow', 'PyTorch', 'Pandas', 'NumPy', 'SQL', 'NoSQL',
-        'Microservices', 'Agile', 'Scrum', 'HTML', 'CSS', 'Tailwind',
-        'Bootstrap', 'Material-UI', 'Redux', 'Next.js', 'Express.js'
-    ]
-    
-    for tech in tech_keywords:
-        if re.search(r'\b' + re.escape(tech) + r'\b', description, re.IGNORECASE):
-            result["skills"].append(tech)
-    
+    result["skills"] = list(dict.fromkeys(keywords['tech']))
+
     # Extract requirements (lines starting with bullet points or numbers)
-    req_patterns = [
-        r'(?:^|\n)\s*[•\-\*]\s*(.+?)(?=\n|$)',
-        r'(?:^|\n)\s*\d+\.\s*(.+?)(?=\n|$)'
-    ]
-    
-    for pattern in req_patterns:
-        matches = re.findall(pattern, description, re.MULTILINE)
-        result["requirements"].extend(matches[:5])  # Limit to 5
-    
-    # Extract education requirements
-    edu_keywords = ["Bachelor", "Master", "PhD", "BS", "MS", "MBA", "degree"]
-    for keyword in edu_keywords:
-        if re.search(r'\b' + keyword + r'\b', description, re.IGNORECASE):
-            edu_match = re.search(r'(.{0,50}' + keyword + r'.{0,50})', description, re.IGNORECASE)
-            if edu_match and keyword not in str(result["education"]):
-                result["education"].append(edu_match.group(0).strip())
-    
-    # Extract benefits
-    benefit_keywords = ["health insurance", "401k", "dental", "vision", "pto", "paid time off",
-                       "remote", "hybrid", "flexible hours", "stock options", "bonus"]
-    for benefit in benefit_keywords:
-        if re.search(r'\b' + benefit + r'\b', description, re.IGNORECASE):
-            result["benefits"].append(benefit.title())
-    
-    # Remove duplicates
-    result["skills"] = list(set(result["skills"]))
-    result["requirements"] = list(set(result["requirements"]))
-    result["education"] = list(set(result["education"]))
-    result["benefits"] = list(set(result["benefits"]))
-    
+    seen_requirements = {}
+    for rx in _REQ_RES:
+        matches = rx.findall(description)
+        seen_requirements.update(dict.fromkeys(matches[:5]))  # Limit to 5
+    result["requirements"] = list(seen_requirements)
+
+    # Education: the context pattern (50 chars around the keyword) only
+    # runs for keywords the single scan actually found
+    for keyword in dict.fromkeys(keywords['edu']):
+        edu_match = EDU_CONTEXT_RES[keyword.lower()].search(description)
+        if edu_match and keyword not in str(result["education"]):
+            result["education"].append(edu_match.group(0).strip())
+
+    # Benefits (deduplicated)
+    for benefit in dict.fromkeys(keywords['benefit']):
+        result["benefits"].append(benefit.title())
+
     return result
 
 def generate_interview_questions(job_title: str, description: str, skills: List[str]) -> List[Dict]:
@@ -172,54 +222,42 @@ def parse_email_for_job(email_content: str) -> Dict:
     }
     
     # Extract URLs
-    url_pattern = r'https?://[^\s<>"]+'
-    urls = re.findall(url_pattern, email_content)
+    urls = URL_RE.findall(email_content)
     if urls:
         result["posting_url"] = urls[0]
-    
+
     # Try to extract company name (look for patterns like "at CompanyName" or "with CompanyName")
-    company_patterns = [
-        r'(?:at|with|for)\s+([A-Z][A-Za-z0-9\s&]+?)(?:\s+(?:is|has|invites))',
-        r'(?:join|work for|career at)\s+([A-Z][A-Za-z0-9\s&]+)',
-    ]
-    
-    for pattern in company_patterns:
-        match = re.search(pattern, email_content)
+    for rx in _COMPANY_RES:
+        match = rx.search(email_content)
         if match:
             result["company"] = match.group(1).strip()
             break
     
-    # Extract job title (look for common job titles)
-    title_keywords = [
-        "Software Engineer", "Senior Engineer", "Full Stack", "Frontend", "Backend",
-        "Data Scientist", "Product Manager", "DevOps", "Engineering Manager"
-    ]
-    
-    for title in title_keywords:
-        if title.lower() in email_content.lower():
+    # Extract job title (look for common job titles; lower the body once)
+    email_lower = email_content.lower()
+    for title, title_lower in _TITLE_KEYWORDS_LOWER:
+        if title_lower in email_lower:
             result["title"] = title
             break
     
     # Extract location
-    location_pattern = r'(?:in|at|location:|based in)\s+([A-Z][a-z]+(?:,\s*[A-Z]{2})?)'
-    loc_match = re.search(location_pattern, email_content)
+    loc_match = _LOCATION_RE.search(email_content)
     if loc_match:
         result["location"] = loc_match.group(1)
-    
+
     # Extract salary
-    salary_patterns = [
-        r'\$\s*(\d{1,3}(?:,\d{3})*(?:k|K)?(?:\s*-\s*\$?\s*\d{1,3}(?:,\d{3})*(?:k|K)?)?)',
-        r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*(?:USD|dollars)',
-    ]
-    
-    for pattern in salary_patterns:
-        match = re.search(pattern, email_content)
+    for rx in SALARY_RES:
+        match = rx.search(email_content)
         if match:
             result["pay"] = match.group(0)
             break
     
     return result
 
+# Batch size for model.encode; the encoder sorts inputs by token length
+# internally so fixed-size batches stay roughly token-balanced
+_ENCODE_BATCH_SIZE = 64
+
 def generate_embeddings(texts: List[str]) -> np.ndarray:
     """
     Generate embeddings for a list of texts
@@ -227,14 +265,228 @@ def generate_embeddings(texts: List[str]) -> np.ndarray:
     model = get_embedding_model()
     if model is None:
         return np.array([])
-    
+
     try:
-        embeddings = model.encode(texts, convert_to_numpy=True)
-        return embeddings
+        # Encode each distinct text once, then scatter back to input order
+        unique_texts = list(dict.fromkeys(texts))
+        embeddings = model.encode(unique_texts, convert_to_numpy=True, batch_size=_ENCODE_BATCH_SIZE)
+        if len(unique_texts) == len(texts):
+            return embeddings
+        index = {text: i for i, text in enumerate(unique_texts)}
+        return embeddings[[index[text] for text in texts]]
     except Exception as e:
         print(f"Error generating embeddings: {e}")
         return np.array([])
 
+def embed_knowledge_item(title: str, content: str) -> Optional[List[float]]:
+    """Unit-normalized embedding for one knowledge item, as a plain list
+    suitable for storing on the Mongo document"""
+    model = get_embedding_model()
+    if model is None:
+        return None
+    try:
+        embedding = _l2_normalize(
+            model.encode([f"{title} {content}"], convert_to_numpy=True)[0])
+        return embedding.astype(np.float32).tolist()
+    except Exception as e:
+        print(f"Error embedding knowledge item: {e}")
+        return None
+
+# Caches so repeated searches don't re-encode unchanged queries/items
+_QUERY_CACHE_MAX = 128
+_query_embedding_cache: Dict[str, np.ndarray] = {}
+
+def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """Normalize embeddings to unit length so cosine similarity is a dot product"""
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    # Guard against zero vectors
+    np.maximum(norms, 1e-12, out=norms)
+    return embeddings / norms
+
+try:
+    from numba import njit  # optional - JIT-compiled scoring kernel
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _cosine_scores(matrix, query):
+        # Hand-rolled dot products beat BLAS dispatch overhead for the
+        # small/medium matrices a personal knowledge base produces
+        n, d = matrix.shape
+        out = np.empty(n, dtype=np.float32)
+        for i in range(n):
+            acc = 0.0
+            for j in range(d):
+                acc += matrix[i, j] * query[j]
+            out[i] = acc
+        return out
+else:
+    # ~2048 rows x 384 float32 dims ~ 3MB per chunk, sized to stay inside
+    # a typical L2 cache alongside the query vector and output slice
+    _SCORE_CHUNK_ROWS = 2048
+
+    def _cosine_scores(matrix, query):
+        n = matrix.shape[0]
+        if n <= _SCORE_CHUNK_ROWS:
+            return matrix @ query
+        out = np.empty(n, dtype=np.result_type(matrix, query))
+        for start in range(0, n, _SCORE_CHUNK_ROWS):
+            end = min(start + _SCORE_CHUNK_ROWS, n)
+            np.dot(matrix[start:end], query, out=out[start:end])
+        return out
+
+_query_cache_lock = threading.Lock()
+
+def _get_query_embedding(model, query: str) -> np.ndarray:
+    embedding = _query_embedding_cache.get(query)
+    if embedding is None:
+        embedding = _l2_normalize(model.encode([query], convert_to_numpy=True)[0]).astype(np.float32)
+        # Search runs on pool threads, so eviction + insert is guarded;
+        # a racing duplicate encode is harmless, a racing pop is not
+        with _query_cache_lock:
+            if len(_query_embedding_cache) >= _QUERY_CACHE_MAX:
+                # Drop the oldest entry (insertion order)
+                _query_embedding_cache.pop(next(iter(_query_embedding_cache)))
+            _query_embedding_cache[query] = embedding
+    return embedding
+
+# Index snapshot on disk: the startup warmup loads it so a restart costs
+# O(load) instead of re-encoding the whole knowledge base
+_INDEX_SNAPSHOT = os.path.join(tempfile.gettempdir(), "careerflow_knowledge_index.npz")
+
+class KnowledgeIndex:
+    """Struct-of-arrays store for knowledge embeddings.
+
+    Ids, texts and embeddings live in parallel arrays (one contiguous
+    float16 matrix for the vectors) instead of a dict of per-item tuples,
+    so search feeds row slices straight to the scoring kernel and only
+    new or changed items are ever re-encoded.
+    """
+
+    def __init__(self):
+        # Searches run on pool threads (asyncio.to_thread), so every
+        # mutation of the parallel arrays happens under one lock - same
+        # idiom as _embedding_model_lock for model loading
+        self._lock = threading.Lock()
+        self._row_by_id: Dict[str, int] = {}
+        self._texts: List[str] = []
+        self._embeddings: Optional[np.ndarray] = None  # [capacity, dim] float16
+        self._count = 0
+        self._save_pending = False
+
+    def _ensure_capacity(self, needed: int, dim: int):
+        if self._embeddings is None:
+            capacity = max(64, needed)
+            self._embeddings = np.empty((capacity, dim), dtype=np.float16)
+        elif needed > self._embeddings.shape[0]:
+            capacity = max(needed, self._embeddings.shape[0] * 2)
+            grown = np.empty((capacity, dim), dtype=np.float16)
+            grown[:self._count] = self._embeddings[:self._count]
+            self._embeddings = grown
+
+    def sync(self, model, knowledge_items: List[Dict]) -> np.ndarray:
+        """Return a float32 [N, dim] matrix aligned to knowledge_items order,
+        encoding only the items whose text is new or has changed"""
+        texts = [f"{item['title']} {item['content']}" for item in knowledge_items]
+        rows = np.empty(len(knowledge_items), dtype=np.intp)
+        with self._lock:
+            missing = []
+            for i, (item, text) in enumerate(zip(knowledge_items, texts)):
+                row = self._row_by_id.get(item.get('id'))
+                if row is not None and self._texts[row] == text:
+                    rows[i] = row
+                else:
+                    missing.append(i)
+            if missing:
+                # Vectors persisted on the document (at create time) are adopted
+                # as-is; only items without one pay for an encode
+                embeddings_by_index = {
+                    i: np.asarray(knowledge_items[i]['embedding'], dtype=np.float16)
+                    for i in missing if knowledge_items[i].get('embedding')
+                }
+                to_encode = [i for i in missing if i not in embeddings_by_index]
+                if to_encode:
+                    # Stored as float16: halves memory, and unit-norm MiniLM
+                    # vectors lose no meaningful ranking precision at half width
+                    new_embeddings = _l2_normalize(
+                        model.encode([texts[i] for i in to_encode], convert_to_numpy=True)
+                    ).astype(np.float16)
+                    embeddings_by_index.update(zip(to_encode, new_embeddings))
+                for i in missing:
+                    embedding = embeddings_by_index[i]
+                    item_id = knowledge_items[i].get('id')
+                    row = self._row_by_id.get(item_id)
+                    if row is None:
+                        row = self._count
+                        self._ensure_capacity(row + 1, embedding.shape[0])
+                        self._texts.append(texts[i])
+                        self._count += 1
+                        if item_id:
+                            self._row_by_id[item_id] = row
+                    else:
+                        self._texts[row] = texts[i]
+                    self._embeddings[row] = embedding
+                    rows[i] = row
+                if to_encode:
+                    # Only paid-for encode work is worth snapshotting;
+                    # adopted document vectors are cheap to re-adopt
+                    self._schedule_save()
+            # Compute in float32 for a fast BLAS path
+            return self._embeddings[rows].astype(np.float32)
+
+    def _schedule_save(self):
+        """Write the snapshot behind a daemon thread; searches never wait
+        on disk. Called with self._lock held."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        threading.Thread(target=self._write_snapshot,
+                         name="knowledge-index-save", daemon=True).start()
+
+    def _write_snapshot(self):
+        with self._lock:
+            self._save_pending = False
+            try:
+                self.save(_INDEX_SNAPSHOT)
+            except Exception as e:
+                print(f"Error saving knowledge index snapshot: {e}")
+
+    def save(self, path: str):
+        """Persist the index so a restart costs O(load) instead of
+        O(re-encode). Called with self._lock held."""
+        ids = [None] * self._count
+        for item_id, row in self._row_by_id.items():
+            ids[row] = item_id
+        # Write-then-replace so a crash mid-write never leaves a torn file
+        tmp = f"{path}.tmp.npz"
+        np.savez_compressed(
+            tmp,
+            ids=np.array(ids, dtype=object),
+            texts=np.array(self._texts, dtype=object),
+            embeddings=self._embeddings[:self._count] if self._embeddings is not None else np.empty((0, 0), np.float16),
+        )
+        os.replace(tmp, path)
+
+    def load(self, path: str):
+        data = np.load(path, allow_pickle=True)
+        embeddings = data['embeddings']
+        with self._lock:
+            if self._count:
+                # Searches already populated the live index; keep it
+                return
+            self._embeddings = np.ascontiguousarray(embeddings, dtype=np.float16)
+            self._texts = list(data['texts'])
+            self._count = len(self._texts)
+            self._row_by_id = {item_id: row for row, item_id in enumerate(data['ids']) if item_id}
+
+
+_knowledge_index = KnowledgeIndex()
+
+def _get_knowledge_embeddings(model, knowledge_items: List[Dict]) -> np.ndarray:
+    """Return L2-normalized embeddings for all items, re-encoding only new/changed ones"""
+    return _knowledge_index.sync(model, knowledge_items)
+
 def search_knowledge_by_embedding(query: str, knowledge_items: List[Dict], top_k: int = 5) -> List[Dict]:
     """
     Search knowledge base using semantic similarity
@@ -242,30 +494,40 @@ def search_knowledge_by_embedding(query: str, knowledge_items: List[Dict], top_k
     model = get_embedding_model()
     if model is None or not knowledge_items:
         return []
-    
+
     try:
-        # Generate query embedding
-        query_embedding = model.encode([query], convert_to_numpy=True)[0]
-        
-        # Generate embeddings for all knowledge items
-        texts = [f"{item['title']} {item['content']}" for item in knowledge_items]
-        knowledge_embeddings = model.encode(texts, convert_to_numpy=True)
-        
-        # Calculate cosine similarity
-        similarities = np.dot(knowledge_embeddings, query_embedding) / (
-            np.linalg.norm(knowledge_embeddings, axis=1) * np.linalg.norm(query_embedding)
-        )
+        # Generate query embedding (cached across calls)
+        query_embedding = _get_query_embedding(model, query)
+
+        # Generate embeddings for all knowledge items (cached per item)
+        knowledge_embeddings = _get_knowledge_embeddings(model, knowledge_items)
+
+        # Embeddings are pre-normalized, so cosine similarity is one pass
+        # over the matrix (JIT kernel when numba is installed)
+        similarities = _cosine_scores(knowledge_embeddings, query_embedding)
         
-        # Get top k results
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        # Get top k results: argpartition selects in O(N), then only the
+        # k candidates are sorted
+        if top_k < len(similarities):
+            candidates = np.argpartition(similarities, -top_k)[-top_k:]
+        else:
+            candidates = np.arange(len(similarities))
+        top_indices = candidates[np.argsort(similarities[candidates])[::-1]]
         
+        # Build lightweight result dicts instead of copying whole items -
+        # only the fields the UI renders, plus the score
         results = []
         for idx in top_indices:
             if similarities[idx] > 0.3:  # Threshold
-                item = knowledge_items[idx].copy()
-                item['similarity_score'] = float(similarities[idx])
-                results.append(item)
-        
+                item = knowledge_items[idx]
+                results.append({
+                    'id': item.get('id'),
+                    'title': item.get('title'),
+                    'content': item.get('content'),
+                    'tags': item.get('tags', []),
+                    'similarity_score': float(similarities[idx]),
+                })
+
         return results
     except Exception as e:
         print(f"Error in semantic search: {e}")
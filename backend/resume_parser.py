@@ -10,61 +10,86 @@ import re
 from typing import Dict
 import logging
 
+from _patterns import (
+    match_tech_keywords,
+    EXP_RES,
+    EMAIL_RE,
+    PHONE_RE,
+    SUMMARY_RE,
+)
+
 logger = logging.getLogger(__name__)
 
+_DIGIT_RE = re.compile(r'\d')
+
+# Name detection only looks at the top of the resume
+_NAME_SCAN_LINES = 5
+
+# Education lines ("Bachelor ...", "M.S. ...", etc.), compiled once at import
+_EDU_LINE_RES = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r'(Bachelor.*?(?:\n|$))',
+        r'(Master.*?(?:\n|$))',
+        r'(PhD.*?(?:\n|$))',
+        r'(B\.?S\.?.*?(?:\n|$))',
+        r'(M\.?S\.?.*?(?:\n|$))',
+        r'(MBA.*?(?:\n|$))',
+    )
+]
+
 def extract_text_from_pdf(file_bytes: bytes) -> str:
     """Extract text from PDF file using multiple methods for robustness"""
-    text = ""
-    
     # Method 1: PyMuPDF (fitz) - most reliable for complex PDFs
     try:
         import fitz  # PyMuPDF
+        pages = []
         pdf_document = fitz.open(stream=file_bytes, filetype="pdf")
-        for page_num in range(len(pdf_document)):
-            page = pdf_document[page_num]
-            text += page.get_text() + "\n"
+        for page in pdf_document:
+            pages.append(page.get_text())
         pdf_document.close()
-        
-        if text.strip():
+
+        text = "\n".join(pages).strip()
+        if text:
             logger.info(f"PyMuPDF extracted {len(text)} characters")
-            return text.strip()
+            return text
     except Exception as e:
         logger.warning(f"PyMuPDF extraction failed: {e}")
-    
+
     # Method 2: PyPDF2 - fallback
     try:
         from PyPDF2 import PdfReader
-        pdf_file = io.BytesIO(file_bytes)
-        reader = PdfReader(pdf_file)
-        text = ""
+        reader = PdfReader(io.BytesIO(file_bytes))
+        pages = []
         for page in reader.pages:
             page_text = page.extract_text()
             if page_text:
-                text += page_text + "\n"
-        
-        if text.strip():
+                pages.append(page_text)
+
+        text = "\n".join(pages).strip()
+        if text:
             logger.info(f"PyPDF2 extracted {len(text)} characters")
-            return text.strip()
+            return text
     except Exception as e:
         logger.warning(f"PyPDF2 extraction failed: {e}")
-    
+
     # Method 3: pdfplumber - last resort for scanned/OCR PDFs
     try:
         import pdfplumber
-        pdf_file = io.BytesIO(file_bytes)
-        with pdfplumber.open(pdf_file) as pdf:
-            text = ""
+        pages = []
+        with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
             for page in pdf.pages:
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
-        
-        if text.strip():
+                    pages.append(page_text)
+
+        text = "\n".join(pages).strip()
+        if text:
             logger.info(f"pdfplumber extracted {len(text)} characters")
-            return text.strip()
+            return text
     except Exception as e:
         logger.warning(f"pdfplumber extraction failed: {e}")
-    
+
     logger.error("All PDF extraction methods failed")
     return ""
 
@@ -76,19 +101,21 @@ def extract_text_from_docx(file_bytes: bytes) -> str:
         doc = Document(docx_file)
         
         text_parts = []
-        
-        # Extract paragraphs
+
+        # Extract paragraphs (strip each text once)
         for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text.strip())
-        
-        # Extract tables (resumes often have tabular data)
+            text = paragraph.text.strip()
+            if text:
+                text_parts.append(text)
+
+        # Extract tables (resumes often have tabular data); cell.text walks
+        # the XML on every access, so read it exactly once per cell
         for table in doc.tables:
             for row in table.rows:
-                row_text = " | ".join(cell.text.strip() for cell in row.cells if cell.text.strip())
-                if row_text:
-                    text_parts.append(row_text)
-        
+                cells = [text for text in (cell.text.strip() for cell in row.cells) if text]
+                if cells:
+                    text_parts.append(" | ".join(cells))
+
         return "\n".join(text_parts)
     except Exception as e:
         logger.error(f"Error extracting DOCX text: {e}")
@@ -112,85 +139,55 @@ def parse_resume_with_ai(resume_text: str) -> Dict:
         "work_authorization": None
     }
     
-    lines = resume_text.split('\n')
-    
     # Extract email
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, resume_text)
+    email_match = EMAIL_RE.search(resume_text)
     if email_match:
         result["email"] = email_match.group(0)
-    
+
     # Extract phone
-    phone_pattern = r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    phone_match = re.search(phone_pattern, resume_text)
+    phone_match = PHONE_RE.search(resume_text)
     if phone_match:
         result["phone"] = phone_match.group(0)
     
-    # Extract name (usually first non-empty line)
-    for line in lines:
+    # Extract name (usually at the very top, so only scan the first few
+    # non-empty lines instead of walking the whole document)
+    scanned = 0
+    for line in resume_text.split('\n', 4 * _NAME_SCAN_LINES)[:4 * _NAME_SCAN_LINES]:
         line = line.strip()
-        if line and len(line.split()) <= 4 and not any(char.isdigit() for char in line):
+        if not line:
+            continue
+        if len(line.split()) <= 4 and not _DIGIT_RE.search(line):
             result["name"] = line
             break
+        scanned += 1
+        if scanned >= _NAME_SCAN_LINES:
+            break
     
     # Extract years of experience
-    exp_patterns = [
-        r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+experience',
-        r'experience:\s*(\d+)\+?\s*(?:years?|yrs?)'
-    ]
-    for pattern in exp_patterns:
-        match = re.search(pattern, resume_text, re.IGNORECASE)
+    for rx in EXP_RES:
+        match = rx.search(resume_text)
         if match:
             result["experience_years"] = int(match.group(1))
             break
-    
-    # Extract common skills
-    tech_keywords = [
-        'Python', 'Java', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue',
-        'Node.js', 'Django', 'Flask', 'FastAPI', 'Spring', 'AWS', 'Azure', 'GCP',
-        'Docker', 'Kubernetes', 'MongoDB', 'PostgreSQL', 'MySQL', 'Redis',
-        'Git', 'CI/CD', 'REST API', 'GraphQL', 'Machine Learning', 'AI',
-        'TensorFlow', 'PyTorch', 'Pandas', 'NumPy', 'SQL', 'NoSQL',
-        'Microservices', 'Agile', 'Scrum', 'HTML', 'CSS', 'C++', 'C#',
-        'Go', 'Rust', 'Swift', 'Kotlin', 'Ruby', 'PHP', 'Scala'
-    ]
-    
-    for tech in tech_keywords:
-        if re.search(r'\b' + re.escape(tech) + r'\b', resume_text, re.IGNORECASE):
-            result["skills"].append(tech)
-    
-    # Extract education
-    edu_patterns = [
-        r'(Bachelor.*?(?:\n|$))',
-        r'(Master.*?(?:\n|$))',
-        r'(PhD.*?(?:\n|$))',
-        r'(B\.?S\.?.*?(?:\n|$))',
-        r'(M\.?S\.?.*?(?:\n|$))',
-        r'(MBA.*?(?:\n|$))'
-    ]
-    
-    for pattern in edu_patterns:
-        matches = re.finditer(pattern, resume_text, re.IGNORECASE | re.MULTILINE)
-        for match in matches:
+
+    # Extract common skills (single pass, deduplicated in first-seen order)
+    result["skills"] = list(dict.fromkeys(match_tech_keywords(resume_text)))
+
+    # Extract education (deduplicated as it is collected)
+    seen_education = set()
+    for rx in _EDU_LINE_RES:
+        for match in rx.finditer(resume_text):
             edu = match.group(1).strip()
-            if edu and len(edu) < 200:  # Reasonable length
+            if edu and len(edu) < 200 and edu not in seen_education:  # Reasonable length
+                seen_education.add(edu)
                 result["education"].append(edu)
-    
-    # Remove duplicates
-    result["skills"] = list(set(result["skills"]))
-    result["education"] = list(set(result["education"]))
-    
+
+
     # Extract summary (look for "Summary", "About", "Profile" sections)
-    summary_patterns = [
-        r'(?:SUMMARY|PROFESSIONAL SUMMARY|ABOUT|PROFILE|OBJECTIVE)[\s:]+(.+?)(?=\n\n|\n[A-Z]{3,})',
-    ]
-    
-    for pattern in summary_patterns:
-        match = re.search(pattern, resume_text, re.IGNORECASE | re.DOTALL)
-        if match:
-            summary = match.group(1).strip()
-            if 50 < len(summary) < 500:  # Reasonable length
-                result["summary"] = summary
-                break
+    match = SUMMARY_RE.search(resume_text)
+    if match:
+        summary = match.group(1).strip()
+        if 50 < len(summary) < 500:  # Reasonable length
+            result["summary"] = summary
     
     return result
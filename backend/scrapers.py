@@ -4,275 +4,440 @@ Web scraping utilities for job portals
 """
 
 import re
+import socket
+import time
+import ipaddress
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer, NavigableString
+import soupsieve
 import asyncio
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, parse_qsl, urlencode, quote_plus, quote
+
+# lxml's C parser builds the tree several times faster than the pure-Python
+# html.parser; fall back gracefully if it isn't installed
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = 'lxml'
+except ImportError:
+    _BS_PARSER = 'html.parser'
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+_RE_LINKEDIN_JOBID = re.compile(r'/jobs/view/(\d+)')
+
+# Per-portal field selectors in priority order. The selectors for each
+# portal are merged into one combined query so the DOM is walked once per
+# page instead of once per field-and-fallback
+_PORTAL_FIELDS = {
+    'Indeed': [
+        ('title', ['h1[class*=jobsearch-JobInfoHeader]', 'h1']),
+        ('company', ['div[data-company-name]', 'div[class*=company]']),
+        ('location', ['div[data-testid=job-location]', 'div[class*=location]']),
+        ('pay', ['div[class*=salary]', 'span[class*=salary]']),
+        ('description', ['div#jobDescriptionText', 'div[class*=jobDescr]']),
+    ],
+    'Monster': [
+        ('title', ['h1[class*=title]', 'h1']),
+        ('company', ['span[class*=company]', 'div[class*=company]']),
+        ('location', ['span[class*=location]', 'div[class*=location]']),
+        ('description', ['div[class*=description]', 'div[class*=body]']),
+    ],
+    'JobDiva': [
+        ('title', ['h1', 'h2[class*=title]']),
+        ('company', ['div[class*=company]', 'span[class*=company]', 'p[class*=company]']),
+        ('location', ['div[class*=location]', 'span[class*=location]', 'p[class*=location]']),
+        ('description', ['div[class*=description]', 'div[class*=content]', 'div[class*=body]',
+                         'div[id*=description]', 'div[id*=content]']),
+    ],
+    'Generic': [
+        ('title', ['h1']),
+        ('description', ['main', 'article', 'div[class*=content]', 'div[class*=main]']),
+    ],
+}
+
+_COMPILED_FIELDS = {
+    portal: [(field, [soupsieve.compile(s) for s in selectors]) for field, selectors in fields]
+    for portal, fields in _PORTAL_FIELDS.items()
+}
+_COMBINED_SELECTOR = {
+    portal: ', '.join(s for _, selectors in fields for s in selectors)
+    for portal, fields in _PORTAL_FIELDS.items()
+}
+
+def _text_capped(node, limit: int = 2000) -> str:
+    """Like get_text(separator='\\n', strip=True)[:limit], but stops walking
+    the subtree once limit chars are collected instead of building the full
+    text and throwing most of it away"""
+    parts = []
+    total = 0
+    for descendant in node.descendants:
+        if isinstance(descendant, NavigableString):
+            text = descendant.strip()
+            if text:
+                parts.append(text)
+                total += len(text) + 1
+                if total >= limit:
+                    break
+    return '\n'.join(parts)[:limit]
+
+def _extract_fields(soup, portal: str) -> Dict[str, str]:
+    """Fill a portal's fields with a single combined-selector pass.
+
+    Nodes arrive in document order; per field, the candidate matching the
+    highest-priority selector wins (ties go to the earliest node).
+    """
+    fields = _COMPILED_FIELDS[portal]
+    best = {}
+    for node in soup.select(_COMBINED_SELECTOR[portal]):
+        for field, selectors in fields:
+            for rank, pattern in enumerate(selectors):
+                if pattern.match(node):
+                    current = best.get(field)
+                    if current is None or rank < current[0]:
+                        best[field] = (rank, node)
+                    break
+    out = {}
+    for field, _ in fields:
+        hit = best.get(field)
+        if hit is not None:
+            if field == 'description':
+                out[field] = _text_capped(hit[1])
+            else:
+                out[field] = hit[1].get_text(strip=True)
+    return out
+
+# Only materialize the tags each extractor actually queries; the parser
+# discards everything else (head, script, style...) before building nodes
+_STRAINER_INDEED = SoupStrainer(['h1', 'div', 'span'])
+_STRAINER_MONSTER = SoupStrainer(['h1', 'div', 'span'])
+_STRAINER_JOBDIVA = SoupStrainer(['h1', 'h2', 'div', 'span', 'p'])
+_STRAINER_GENERIC = SoupStrainer(['h1', 'main', 'article', 'div'])
+
+# One pooled client shared by every scraper: keep-alive connections skip the
+# TCP+TLS handshake on repeat requests to the same portals
+_client: Optional[httpx.AsyncClient] = None
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers=_HEADERS,
+            follow_redirects=True,
+        )
+    return _client
+
+async def close_client():
+    """Close the shared client (call on app shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+# The extractors read a handful of fields and cap descriptions at 2000
+# chars, so bytes past this point can't change the result
+_MAX_FETCH_BYTES = 512_000
+_MAX_REDIRECTS = 5
+
+def _pin_request(url: str, parsed):
+    """Rewrite a URL to the IP validate_url already resolved.
+
+    Connecting to the cached address closes the window where a hostile
+    DNS server answers differently between validation and fetch, and
+    skips httpx's own second lookup. Returns (target_url, headers,
+    extensions); the original hostname travels in the Host header and
+    as the TLS SNI name.
+    """
+    host = parsed.hostname or ''
+    cached = _dns_cache.get(host)
+    if cached is None or not cached[1]:
+        return url, None, None
+    ip = cached[1][0][4][0]
+    netloc = f'[{ip}]' if ':' in ip else ip
+    if parsed.port:
+        netloc = f'{netloc}:{parsed.port}'
+    target = parsed._replace(netloc=netloc).geturl()
+    return target, {'Host': host}, {'sni_hostname': host}
+
+async def _fetch_capped(url: str) -> Optional[str]:
+    """GET a page, but stop reading once _MAX_FETCH_BYTES have arrived.
+
+    Returns the decoded head of the document, or None on a non-200 status.
+    Redirects are followed manually so each hop is re-validated against
+    the SSRF rules rather than trusted blindly.
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        parsed = urlparse(url)
+        target, headers, extensions = _pin_request(url, parsed)
+        async with get_client().stream(
+            'GET', target, headers=headers, extensions=extensions,
+            follow_redirects=False,
+        ) as response:
+            if response.is_redirect:
+                location = response.headers.get('location')
+                if not location:
+                    return None
+                url = str(httpx.URL(url).join(location))
+                if not await validate_url(url):
+                    return None
+                continue
+            if response.status_code != 200:
+                return None
+            chunks = []
+            total = 0
+            async for chunk in response.aiter_bytes(chunk_size=65536):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= _MAX_FETCH_BYTES:
+                    break
+            return b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace')
+    return None
+
+# Resolved hostnames are cached briefly so repeat scrapes of the same
+# handful of portals skip the DNS round-trip
+_DNS_CACHE_TTL = 300
+_DNS_CACHE_MAX = 256
+_dns_cache: Dict[str, tuple] = {}
+
+async def _resolve_host(hostname: str) -> list:
+    cached = _dns_cache.get(hostname)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _DNS_CACHE_TTL:
+        return cached[1]
+    loop = asyncio.get_running_loop()
+    # SOCK_STREAM filters out the duplicate DGRAM/RAW entries
+    addr_info = await loop.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+    if len(_dns_cache) >= _DNS_CACHE_MAX:
+        _dns_cache.pop(next(iter(_dns_cache)))
+    _dns_cache[hostname] = (now, addr_info)
+    return addr_info
+
+# Non-public address space as precomputed integer ranges: a few int
+# comparisons per address instead of walking ipaddress's network lists
+# through is_private/is_loopback/... on every resolved IP
+_BLOCKED_V4 = tuple(
+    (int(n.network_address), int(n.broadcast_address))
+    for n in map(ipaddress.ip_network, (
+        '0.0.0.0/8', '10.0.0.0/8', '100.64.0.0/10', '127.0.0.0/8',
+        '169.254.0.0/16', '172.16.0.0/12', '192.0.0.0/24', '192.0.2.0/24',
+        '192.168.0.0/16', '198.18.0.0/15', '198.51.100.0/24',
+        '203.0.113.0/24', '224.0.0.0/3',
+    ))
+)
+_BLOCKED_V6 = tuple(
+    (int(n.network_address), int(n.broadcast_address))
+    for n in map(ipaddress.ip_network, (
+        '::/8', '64:ff9b::/96', '100::/64', '2001::/23', 'fc00::/7',
+        'fe80::/10', 'ff00::/8',
+    ))
+)
+
+def _is_public_ip(ip_obj) -> bool:
+    n = int(ip_obj)
+    blocks = _BLOCKED_V4 if ip_obj.version == 4 else _BLOCKED_V6
+    for start, end in blocks:
+        if start <= n <= end:
+            return False
+    return True
+
+async def validate_url(url: str, parsed=None) -> bool:
+    """
+    Validate that a URL is safe to scrape (SSRF guard)
+    Rejects non-http(s) schemes and hosts resolving to private/loopback addresses
+    """
+    if parsed is None:
+        parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https'):
+        return False
+    try:
+        hostname = parsed.hostname  # raises ValueError on malformed IPv6 brackets
+    except ValueError:
+        return False
+    if not hostname:
+        return False
+    # IP-literal URLs (the usual SSRF probe) are checked directly -
+    # no DNS lookup to pay for, and no resolver to spoof
+    try:
+        ip_obj = ipaddress.ip_address(hostname.strip('[]'))
+    except ValueError:
+        pass
+    else:
+        return _is_public_ip(ip_obj)
+    try:
+        addr_info = await _resolve_host(hostname)
+    except (socket.gaierror, OSError):
+        return False
+    for info in addr_info:
+        if not _is_public_ip(ipaddress.ip_address(info[4][0])):
+            return False
+    return bool(addr_info)
+
+def _registrable(host: str) -> str:
+    """Reduce a hostname to its registrable suffix ('www.indeed.com' -> 'indeed.com')"""
+    if host.startswith('www.'):
+        host = host[4:]
+    return '.'.join(host.rsplit('.', 2)[-2:])
+
+# Users re-paste the same job URLs and dashboards re-trigger scrapes, so
+# results are cached briefly; hits cost no network or parse work at all
+_SCRAPE_CACHE_TTL = 600
+_SCRAPE_CACHE_MAX = 2048
+_scrape_cache: Dict[str, tuple] = {}
+_TRACKING_PARAMS = ('gclid', 'fbclid', 'msclkid')
+
+def _canonical_url(parsed) -> str:
+    """Cache key for a job URL: lowercased host, tracking params and fragment dropped"""
+    query = [(k, v) for k, v in parse_qsl(parsed.query)
+             if not k.startswith('utm_') and k not in _TRACKING_PARAMS]
+    return parsed._replace(netloc=parsed.netloc.lower(),
+                           query=urlencode(query), fragment='').geturl()
 
 async def scrape_job_from_url(url: str) -> Dict:
     """
     Scrape job details from a URL
     Detects the job portal and uses appropriate scraper
     """
-    domain = urlparse(url).netloc.lower()
-    
-    if 'linkedin.com' in domain:
-        return await scrape_linkedin(url)
-    elif 'indeed.com' in domain:
-        return await scrape_indeed(url)
-    elif 'monster.com' in domain:
-        return await scrape_monster(url)
-    elif 'jobdiva.com' in domain:
-        return await scrape_jobdiva(url)
-    else:
-        return await scrape_generic(url)
+    # Parse once; validate_url, the cache key and dispatch all reuse it
+    parsed = urlparse(url)
+    if not await validate_url(url, parsed):
+        return {
+            **_SOURCE_TEMPLATES['Unknown'],
+            "description": "URL rejected: only public http(s) addresses can be scraped",
+            "posting_url": url
+        }
+
+    key = _canonical_url(parsed)
+    now = time.monotonic()
+    cached = _scrape_cache.get(key)
+    if cached is not None and now - cached[0] < _SCRAPE_CACHE_TTL:
+        # Copy so callers mutating the result don't poison the cache
+        return dict(cached[1])
+
+    handler = _SCRAPERS.get(_registrable((parsed.hostname or '').lower()), scrape_generic)
+    result = await handler(url)
+
+    if len(_scrape_cache) >= _SCRAPE_CACHE_MAX:
+        _scrape_cache.pop(next(iter(_scrape_cache)))
+    _scrape_cache[key] = (now, result)
+    return dict(result)
+
+async def scrape_many(urls: List[str], concurrency: int = 64) -> List[Dict]:
+    """
+    Scrape several job URLs concurrently
+    Bounded overall, and at most 8 in flight per host so a batch of URLs
+    from one portal doesn't trip its rate limits
+    """
+    sem = asyncio.Semaphore(concurrency)
+    host_sems: Dict[str, asyncio.Semaphore] = {}
+
+    async def _one(url: str) -> Dict:
+        host = (urlparse(url).hostname or '').lower()
+        host_sem = host_sems.get(host)
+        if host_sem is None:
+            host_sem = host_sems.setdefault(host, asyncio.Semaphore(8))
+        async with sem, host_sem:
+            return await scrape_job_from_url(url)
+
+    results = await asyncio.gather(*(_one(url) for url in urls), return_exceptions=True)
+    # Failures come back in the same result-dict shape the scrapers
+    # produce, instead of leaking raw exception objects to callers
+    return [
+        result if not isinstance(result, BaseException) else {
+            **_SOURCE_TEMPLATES['Unknown'],
+            "description": f"Error scraping: {result}",
+            "posting_url": url,
+        }
+        for url, result in zip(urls, results)
+    ]
+
+_LINKEDIN_MSG = ("LinkedIn scraping requires authentication. "
+                 "Please manually copy job details or use the email parser.")
+
+_LINKEDIN_TEMPLATE = {
+    "title": None,
+    "company": None,
+    "location": None,
+    "description": _LINKEDIN_MSG,
+    "source": "LinkedIn"
+}
 
 async def scrape_linkedin(url: str) -> Dict:
     """
     Scrape LinkedIn job posting
-    Note: LinkedIn requires authentication, this is a basic scraper
+    Note: LinkedIn requires authentication, so this only extracts the job
+    ID from the URL and returns a guidance message (no I/O)
     """
-    # For MVP, we'll extract from URL patterns and return template
-    # Full implementation would need Playwright with authentication
-    
-    result = {
-        "title": None,
-        "company": None,
-        "location": None,
-        "description": None,
-        "source": "LinkedIn"
-    }
-    
-    # Try to extract job ID from URL
-    job_id_match = re.search(r'/jobs/view/(\d+)', url)
+    result = dict(_LINKEDIN_TEMPLATE)
+
+    job_id_match = _RE_LINKEDIN_JOBID.search(url)
     if job_id_match:
         result["posting_url"] = url
         result["notes"] = f"LinkedIn Job ID: {job_id_match.group(1)}"
-    
-    # LinkedIn scraping requires authentication
-    # For now, return a message
-    result["description"] = "LinkedIn scraping requires authentication. Please manually copy job details or use the email parser."
-    
+
     return result
 
-async def scrape_indeed(url: str) -> Dict:
-    """
-    Scrape Indeed job posting
-    """
-    import httpx
-    
-    result = {
-        "title": None,
-        "company": None,
-        "location": None,
-        "description": None,
-        "pay": None,
-        "source": "Indeed",
-        "posting_url": url
-    }
-    
+_STRAINERS = {
+    'Indeed': _STRAINER_INDEED,
+    'Monster': _STRAINER_MONSTER,
+    'JobDiva': _STRAINER_JOBDIVA,
+    'Generic': _STRAINER_GENERIC,
+}
+
+# Base result shape per source, copy-constructed per call instead of
+# rebuilding the literal each time
+_RESULT_FIELDS = {"title": None, "company": None, "location": None, "description": None}
+_SOURCE_TEMPLATES = {
+    'Indeed': {**_RESULT_FIELDS, "pay": None, "source": "Indeed"},
+    'Monster': {**_RESULT_FIELDS, "pay": None, "source": "Monster"},
+    'JobDiva': {**_RESULT_FIELDS, "source": "JobDiva"},
+    'Generic': {**_RESULT_FIELDS, "source": "Generic"},
+    'Unknown': {**_RESULT_FIELDS, "source": "Unknown"},
+}
+
+async def _scrape(url: str, source: str) -> Dict:
+    """Shared fetch/parse/extract driver; per-portal behaviour lives in the
+    selector tables and strainers keyed by source"""
+    result = {**_SOURCE_TEMPLATES[source], "posting_url": url}
+
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract title
-                title_elem = soup.find('h1', class_=re.compile('jobsearch-JobInfoHeader'))
-                if not title_elem:
-                    title_elem = soup.find('h1')
-                if title_elem:
-                    result["title"] = title_elem.get_text(strip=True)
-                
-                # Extract company
-                company_elem = soup.find('div', {'data-company-name': True})
-                if not company_elem:
-                    company_elem = soup.find('div', class_=re.compile('company'))
-                if company_elem:
-                    result["company"] = company_elem.get_text(strip=True)
-                
-                # Extract location
-                location_elem = soup.find('div', {'data-testid': 'job-location'})
-                if not location_elem:
-                    location_elem = soup.find('div', class_=re.compile('location'))
-                if location_elem:
-                    result["location"] = location_elem.get_text(strip=True)
-                
-                # Extract salary
-                salary_elem = soup.find('div', class_=re.compile('salary'))
-                if not salary_elem:
-                    salary_elem = soup.find('span', class_=re.compile('salary'))
-                if salary_elem:
-                    result["pay"] = salary_elem.get_text(strip=True)
-                
-                # Extract description
-                desc_elem = soup.find('div', id='jobDescriptionText')
-                if not desc_elem:
-                    desc_elem = soup.find('div', class_=re.compile('jobDescr'))
-                if desc_elem:
-                    result["description"] = desc_elem.get_text(separator='\n', strip=True)[:2000]
-                
+        text = await _fetch_capped(url)
+
+        if text is not None:
+            soup = BeautifulSoup(text, _BS_PARSER, parse_only=_STRAINERS[source])
+            result.update(_extract_fields(soup, source))
+
     except Exception as e:
-        result["description"] = f"Error scraping Indeed: {str(e)}"
-    
+        result["description"] = f"Error scraping {source}: {str(e)}"
+
     return result
 
+async def scrape_indeed(url: str) -> Dict:
+    """Scrape Indeed job posting"""
+    return await _scrape(url, 'Indeed')
+
 async def scrape_monster(url: str) -> Dict:
-    """
-    Scrape Monster job posting
-    """
-    import httpx
-    
-    result = {
-        "title": None,
-        "company": None,
-        "location": None,
-        "description": None,
-        "pay": None,
-        "source": "Monster",
-        "posting_url": url
-    }
-    
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract title
-                title_elem = soup.find('h1', class_=re.compile('job.*title|title'))
-                if not title_elem:
-                    title_elem = soup.find('h1')
-                if title_elem:
-                    result["title"] = title_elem.get_text(strip=True)
-                
-                # Extract company
-                company_elem = soup.find('span', class_=re.compile('company'))
-                if not company_elem:
-                    company_elem = soup.find('div', class_=re.compile('company'))
-                if company_elem:
-                    result["company"] = company_elem.get_text(strip=True)
-                
-                # Extract location
-                location_elem = soup.find('span', class_=re.compile('location'))
-                if not location_elem:
-                    location_elem = soup.find('div', class_=re.compile('location'))
-                if location_elem:
-                    result["location"] = location_elem.get_text(strip=True)
-                
-                # Extract description
-                desc_elem = soup.find('div', class_=re.compile('description|job.*body'))
-                if desc_elem:
-                    result["description"] = desc_elem.get_text(separator='\n', strip=True)[:2000]
-                
-    except Exception as e:
-        result["description"] = f"Error scraping Monster: {str(e)}"
-    
-    return result
+    """Scrape Monster job posting"""
+    return await _scrape(url, 'Monster')
 
 async def scrape_jobdiva(url: str) -> Dict:
-    """
-    Scrape JobDiva posting
-    """
-    import httpx
-    
-    result = {
-        "title": None,
-        "company": None,
-        "location": None,
-        "description": None,
-        "source": "JobDiva",
-        "posting_url": url
-    }
-    
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # JobDiva has various layouts, try multiple selectors
-                title_elem = soup.find('h1') or soup.find('h2', class_=re.compile('title'))
-                if title_elem:
-                    result["title"] = title_elem.get_text(strip=True)
-                
-                # Try to find job details in various formats
-                details = soup.find_all(['div', 'span', 'p'], class_=re.compile('detail|info'))
-                
-                for detail in details:
-                    text = detail.get_text(strip=True)
-                    if 'location' in detail.get('class', []):
-                        result["location"] = text
-                    elif 'company' in detail.get('class', []):
-                        result["company"] = text
-                
-                # Extract description
-                desc_elem = soup.find('div', class_=re.compile('description|content|body'))
-                if not desc_elem:
-                    desc_elem = soup.find('div', id=re.compile('description|content'))
-                if desc_elem:
-                    result["description"] = desc_elem.get_text(separator='\n', strip=True)[:2000]
-                
-    except Exception as e:
-        result["description"] = f"Error scraping JobDiva: {str(e)}"
-    
-    return result
+    """Scrape JobDiva posting"""
+    return await _scrape(url, 'JobDiva')
 
 async def scrape_generic(url: str) -> Dict:
-    """
-    Generic web scraper for unknown job portals
-    """
-    import httpx
-    
-    result = {
-        "title": None,
-        "company": None,
-        "location": None,
-        "description": None,
-        "source": "Generic",
-        "posting_url": url
-    }
-    
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Try to extract title from h1 or title tag
-                title_elem = soup.find('h1')
-                if title_elem:
-                    result["title"] = title_elem.get_text(strip=True)
-                
-                # Try to extract main content
-                main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=re.compile('content|main'))
-                if main_content:
-                    result["description"] = main_content.get_text(separator='\n', strip=True)[:2000]
-                
-    except Exception as e:
-        result["description"] = f"Error scraping URL: {str(e)}"
-    
-    return result
+    """Generic web scraper for unknown job portals"""
+    return await _scrape(url, 'Generic')
+
+# Registrable suffix -> portal scraper; anything else falls back to generic
+_SCRAPERS = {
+    'linkedin.com': scrape_linkedin,
+    'indeed.com': scrape_indeed,
+    'monster.com': scrape_monster,
+    'jobdiva.com': scrape_jobdiva,
+}
 
 async def search_jobs(query: str, location: str = "", num_results: int = 10) -> List[Dict]:
     """
@@ -281,28 +446,31 @@ async def search_jobs(query: str, location: str = "", num_results: int = 10) ->
     """
     results = []
     
-    # Indeed search
-    indeed_search_url = f"https://www.indeed.com/jobs?q={query.replace(' ', '+')}&l={location.replace(' ', '+')}"
+    # Indeed search (proper query-string escaping, '+' for spaces)
+    indeed_search_url = "https://www.indeed.com/jobs?" + urlencode(
+        {'q': query, 'l': location}, quote_via=quote_plus)
     results.append({
         "portal": "Indeed",
         "search_url": indeed_search_url,
         "note": "Visit this URL to see job listings, then paste individual job URLs to scrape"
     })
-    
-    # LinkedIn search
-    linkedin_search_url = f"https://www.linkedin.com/jobs/search/?keywords={query.replace(' ', '%20')}&location={location.replace(' ', '%20')}"
+
+    # LinkedIn search (%20 for spaces)
+    linkedin_search_url = "https://www.linkedin.com/jobs/search/?" + urlencode(
+        {'keywords': query, 'location': location}, quote_via=quote)
     results.append({
         "portal": "LinkedIn",
         "search_url": linkedin_search_url,
         "note": "LinkedIn requires login. Visit URL in browser, then copy job URLs"
     })
-    
-    # Monster search
-    monster_search_url = f"https://www.monster.com/jobs/search?q={query.replace(' ', '-')}&where={location.replace(' ', '-')}"
+
+    # Monster search (hyphen-joined terms)
+    monster_search_url = "https://www.monster.com/jobs/search?" + urlencode(
+        {'q': '-'.join(query.split()), 'where': '-'.join(location.split())})
     results.append({
         "portal": "Monster",
         "search_url": monster_search_url,
         "note": "Visit this URL to see job listings, then paste individual job URLs to scrape"
     })
-    
+
     return results
@@ -1,45 +1,79 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+
+try:
+    import orjson  # optional - Rust-backed JSON, ~2-5x faster than stdlib
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    orjson = None
+    from fastapi.responses import JSONResponse as _DefaultResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
 from typing import List, Optional
 from datetime import datetime, timezone, timedelta
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+from functools import lru_cache
+import jwt
+from jwt import InvalidTokenError
+import asyncio
+import bcrypt
+import hashlib
 import os
+import sys
+import time
 import logging
 import json
 from pathlib import Path
 import uuid
+import httpx
+import litellm
 from litellm import acompletion
 from ai_features import (
     parse_job_description,
     generate_interview_questions,
     parse_email_for_job,
     search_knowledge_by_embedding,
-    extract_learning_path
+    extract_learning_path,
+    preload_embedding_model,
+    embed_knowledge_item
 )
 from scrapers import scrape_job_from_url, search_jobs
 from resume_parser import extract_text_from_pdf, extract_text_from_docx, parse_resume_with_ai
 
+try:
+    import uvloop  # optional - libuv event loop, noticeably faster for motor/httpx I/O
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# tz_aware keeps reads returning timezone-aware datetimes (UTC), so
+# BSON Dates serialize with the same +00:00 offset the old ISO strings had
+client = AsyncIOMotorClient(mongo_url, tz_aware=True, tzinfo=timezone.utc)
 db = client[os.environ['DB_NAME']]
 
 # Security
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 43200  # 30 days
 
-app = FastAPI()
+# One pooled HTTP client for every LLM completion, so sustained chat load
+# reuses connections instead of paying TLS setup per call
+litellm.aclient_session = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=30.0
+)
+
+app = FastAPI(default_response_class=_DefaultResponse)
 api_router = APIRouter(prefix="/api")
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -47,6 +81,13 @@ logger = logging.getLogger(__name__)
 
 # ============ MODELS ============
 
+def _new_id() -> str:
+    """uuid4 as hex - same entropy as str(uuid4()), skips the dash formatting"""
+    return uuid.uuid4().hex
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 class UserCreate(BaseModel):
     email: EmailStr
     password: str
@@ -58,13 +99,13 @@ class UserLogin(BaseModel):
 
 class User(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     email: EmailStr
     name: str
     resume_info: Optional[str] = None
     visa_status: Optional[str] = None
     restrictions: Optional[List[str]] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
     # New profile fields
     resume_summary: Optional[str] = None
     skills: Optional[List[str]] = []
@@ -104,7 +145,7 @@ class JobCreate(BaseModel):
 
 class Job(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     title: str
     company: str
@@ -120,8 +161,8 @@ class Job(BaseModel):
     notes: Optional[str] = None
     is_deleted: bool = False
     deleted_at: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
 class CompanyCreate(BaseModel):
     name: str
@@ -134,7 +175,7 @@ class CompanyCreate(BaseModel):
 
 class Company(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     name: str
     about: Optional[str] = None
@@ -145,7 +186,7 @@ class Company(BaseModel):
     user_comments: Optional[str] = None
     is_deleted: bool = False
     deleted_at: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 class ContactCreate(BaseModel):
     name: str
@@ -159,7 +200,7 @@ class ContactCreate(BaseModel):
 
 class Contact(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     name: str
     email: Optional[str] = None
@@ -171,7 +212,7 @@ class Contact(BaseModel):
     last_touch_date: Optional[datetime] = None
     is_deleted: bool = False
     deleted_at: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 class ChatMessageCreate(BaseModel):
     message: str
@@ -179,12 +220,12 @@ class ChatMessageCreate(BaseModel):
 
 class ChatMessage(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     session_id: str
     message: str
     response: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 class LLMConfigCreate(BaseModel):
     provider: str
@@ -194,13 +235,13 @@ class LLMConfigCreate(BaseModel):
 
 class LLMConfig(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     provider: str
     model: str
     api_key: Optional[str] = None
     base_url: Optional[str] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 class TodoCreate(BaseModel):
     title: str
@@ -209,7 +250,7 @@ class TodoCreate(BaseModel):
 
 class Todo(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     title: str
     completed: bool = False
@@ -217,7 +258,7 @@ class Todo(BaseModel):
     due_date: Optional[datetime] = None
     is_deleted: bool = False
     deleted_at: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 class KnowledgeCreate(BaseModel):
     title: str
@@ -226,14 +267,14 @@ class KnowledgeCreate(BaseModel):
 
 class Knowledge(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     title: str
     content: str
     tags: Optional[List[str]] = []
     is_deleted: bool = False
     deleted_at: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 class PromptCreate(BaseModel):
     title: str
@@ -242,12 +283,12 @@ class PromptCreate(BaseModel):
 
 class Prompt(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     title: str
     content: str
     category: Optional[str] = "general"
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 class JobPortalCreate(BaseModel):
     name: str
@@ -257,7 +298,7 @@ class JobPortalCreate(BaseModel):
 
 class JobPortal(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     name: str
     url: str
@@ -266,7 +307,7 @@ class JobPortal(BaseModel):
     success_rate: Optional[float] = 0.0
     jobs_applied: Optional[int] = 0
     last_used: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 class ReminderCreate(BaseModel):
     job_id: Optional[str] = None
@@ -276,7 +317,7 @@ class ReminderCreate(BaseModel):
 
 class Reminder(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     job_id: Optional[str] = None
     reminder_date: datetime
@@ -285,7 +326,7 @@ class Reminder(BaseModel):
     completed: bool = False
     is_deleted: bool = False
     deleted_at: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 class TargetCreate(BaseModel):
     title: str
@@ -297,7 +338,7 @@ class TargetCreate(BaseModel):
 
 class Target(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     title: str
     target_type: str
@@ -305,7 +346,7 @@ class Target(BaseModel):
     current_value: int = 0
     deadline: Optional[datetime] = None
     period: str = "weekly"
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 class SystemCreate(BaseModel):
     name: str
@@ -315,24 +356,39 @@ class SystemCreate(BaseModel):
 
 class System(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     name: str
     description: str
     frequency: str
     tasks: List[str]
     last_executed: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+
+# Intern field names once so the per-document dict lookups in
+# model_construct hit CPython's interned-key fast path on list reads
+for _model in (User, Job, Company, Contact, ChatMessage, LLMConfig, Todo,
+               Knowledge, Prompt, JobPortal, Reminder, Target, System):
+    for _field in _model.model_fields:
+        sys.intern(_field)
 
 # ============ HELPER FUNCTIONS ============
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+# bcrypt takes ~100-300ms per call by design, so both helpers run it in a
+# worker thread to keep the event loop free for concurrent requests
+async def hash_password(password: str) -> str:
+    hashed = await asyncio.to_thread(bcrypt.hashpw, password.encode(), bcrypt.gensalt(rounds=12))
+    return hashed.decode()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if not hashed_password:
+        return False
+    try:
+        return await asyncio.to_thread(bcrypt.checkpw, plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        return False
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -342,33 +398,44 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+@lru_cache(maxsize=10000)
+def _decode_token(token: str) -> tuple:
+    """Verify a JWT once and cache (sub, exp); tokens repeat across requests"""
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    return payload.get("sub"), payload.get("exp", 0)
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-        return user_id
-    except JWTError:
+        user_id, exp = _decode_token(credentials.credentials)
+    except InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-
-def serialize_doc(doc):
-    """Convert datetime objects to ISO strings for MongoDB storage"""
-    if isinstance(doc, dict):
-        return {k: v.isoformat() if isinstance(v, datetime) else v for k, v in doc.items()}
-    return doc
-
-def deserialize_doc(doc):
-    """Convert ISO strings back to datetime objects"""
-    if isinstance(doc, dict):
-        for key in ['created_at', 'updated_at', 'timestamp', 'applied_date', 'due_date', 'last_touch_date']:
-            if key in doc and isinstance(doc[key], str):
-                try:
-                    doc[key] = datetime.fromisoformat(doc[key])
-                except:
-                    pass
-    return doc
+    # cached decodes skip the library's expiry check, so re-check here
+    if user_id is None or exp < datetime.now(timezone.utc).timestamp():
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+    return user_id
+
+def _json_default(obj):
+    return obj.isoformat() if isinstance(obj, datetime) else str(obj)
+
+def _dump_doc(doc) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(doc)
+    return json.dumps(doc, default=_json_default).encode()
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+async def _stream_json_array(cursor):
+    """Yield a JSON array straight off a motor cursor, one document at a time,
+    so list responses never materialize both the Mongo batch and a Python list"""
+    yield b"["
+    first = True
+    async for doc in cursor:
+        if first:
+            first = False
+        else:
+            yield b","
+        yield _dump_doc(doc)
+    yield b"]"
 
 # ============ AUTH ROUTES ============
 
@@ -383,9 +450,9 @@ async def register(user: UserCreate):
         name=user.name
     )
     user_dict = user_obj.model_dump()
-    user_dict['password_hash'] = hash_password(user.password)
+    user_dict['password_hash'] = await hash_password(user.password)
     
-    await db.users.insert_one(serialize_doc(user_dict))
+    await db.users.insert_one(user_dict)
     
     access_token = create_access_token(data={"sub": user_obj.id})
     return {"access_token": access_token, "token_type": "bearer"}
@@ -393,7 +460,7 @@ async def register(user: UserCreate):
 @api_router.post("/auth/login", response_model=Token)
 async def login(user: UserLogin):
     db_user = await db.users.find_one({"email": user.email})
-    if not db_user or not verify_password(user.password, db_user.get('password_hash', '')):
+    if not db_user or not await verify_password(user.password, db_user.get('password_hash', '')):
         raise HTTPException(status_code=401, detail="Incorrect email or password")
     
     access_token = create_access_token(data={"sub": db_user['id']})
@@ -404,21 +471,28 @@ async def get_me(user_id: str = Depends(get_current_user)):
     user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return deserialize_doc(user)
+    # Documents we wrote ourselves are already valid, so skip re-validation
+    return User.model_construct(**user)
 
 @api_router.put("/auth/profile", response_model=User)
 async def update_profile(profile: ProfileUpdate, user_id: str = Depends(get_current_user)):
     """Update user profile with resume, skills, and preferences"""
-    update_data = {k: v for k, v in profile.model_dump().items() if v is not None}
-    
-    if update_data:
-        await db.users.update_one(
-            {"id": user_id},
-            {"$set": update_data}
-        )
-    
-    user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
-    return deserialize_doc(user)
+    # exclude_unset dumps only the fields the client actually sent, which is
+    # faster than filtering a full dump and lets an explicit null clear a field
+    update_data = profile.model_dump(exclude_unset=True)
+    
+    if not update_data:
+        user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
+        return User.model_construct(**user)
+    
+    # fuse the write and read-back into a single round-trip
+    user = await db.users.find_one_and_update(
+        {"id": user_id},
+        {"$set": update_data},
+        projection={"_id": 0, "password_hash": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    return User.model_construct(**user)
 
 # ============ JOBS ROUTES ============
 
@@ -428,47 +502,69 @@ async def create_job(job: JobCreate, user_id: str = Depends(get_current_user)):
     if job.status == "applied" and not job_obj.applied_date:
         job_obj.applied_date = datetime.now(timezone.utc)
     
-    await db.jobs.insert_one(serialize_doc(job_obj.model_dump()))
+    await db.jobs.insert_one(job_obj.model_dump())
     return job_obj
 
-@api_router.get("/jobs", response_model=List[Job])
-async def get_jobs(user_id: str = Depends(get_current_user)):
-    jobs = await db.jobs.find({"user_id": user_id, "is_deleted": {"$ne": True}}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(job) for job in jobs]
+def _list_projection(fields: Optional[str], exclude: tuple = ()) -> dict:
+    """Build a Mongo projection from a comma-separated ?fields= param"""
+    projection = {"_id": 0}
+    if fields:
+        projection.update({field: 1 for field in fields.split(",") if field})
+        projection["id"] = 1
+    else:
+        # Internal-only columns stay out of unfiltered list payloads
+        projection.update({field: 0 for field in exclude})
+    return projection
+
+@api_router.get("/jobs")
+async def get_jobs(limit: int = 1000, offset: int = 0, fields: Optional[str] = None,
+                   user_id: str = Depends(get_current_user)):
+    # List endpoints return the stored docs as-is instead of round-tripping
+    # through Pydantic; the response class serializes BSON Dates directly.
+    # limit/offset/fields let callers page and fetch only the columns shown.
+    limit = min(max(limit, 1), 1000)
+    jobs = await db.jobs.find(
+        {"user_id": user_id, "is_deleted": {"$ne": True}}, _list_projection(fields)
+    ).skip(max(offset, 0)).limit(limit).to_list(limit)
+    return jobs
 
 @api_router.get("/jobs/{job_id}", response_model=Job)
 async def get_job(job_id: str, user_id: str = Depends(get_current_user)):
     job = await db.jobs.find_one({"id": job_id, "user_id": user_id}, {"_id": 0})
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return deserialize_doc(job)
+    return Job.model_construct(**job)
 
 @api_router.put("/jobs/{job_id}", response_model=Job)
 async def update_job(job_id: str, job_update: JobCreate, user_id: str = Depends(get_current_user)):
-    existing_job = await db.jobs.find_one({"id": job_id, "user_id": user_id})
-    if not existing_job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
+    now = datetime.now(timezone.utc)
     update_data = job_update.model_dump()
-    update_data['updated_at'] = datetime.now(timezone.utc)
-    
-    if job_update.status == "applied" and not existing_job.get('applied_date'):
-        update_data['applied_date'] = datetime.now(timezone.utc)
-    
-    await db.jobs.update_one(
+    update_data['updated_at'] = now
+
+    # Pipeline update fuses the existence check, the conditional
+    # applied_date stamp and the read-back into one round-trip. $literal
+    # keeps user-supplied strings from being parsed as expressions.
+    update_set = {field: {"$literal": value} for field, value in update_data.items()}
+    if job_update.status == "applied":
+        # Stamp applied_date only on the first transition to applied
+        update_set['applied_date'] = {"$ifNull": ["$applied_date", now]}
+
+    updated_job = await db.jobs.find_one_and_update(
         {"id": job_id, "user_id": user_id},
-        {"$set": serialize_doc(update_data)}
+        [{"$set": update_set}],
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
     )
-    
-    updated_job = await db.jobs.find_one({"id": job_id}, {"_id": 0})
-    return deserialize_doc(updated_job)
+    if not updated_job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return Job.model_construct(**updated_job)
 
 @api_router.delete("/jobs/{job_id}")
 async def delete_job(job_id: str, user_id: str = Depends(get_current_user)):
     # Soft delete
     result = await db.jobs.update_one(
         {"id": job_id, "user_id": user_id, "is_deleted": {"$ne": True}},
-        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}}
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -476,30 +572,41 @@ async def delete_job(job_id: str, user_id: str = Depends(get_current_user)):
 
 # ============ COMPANIES ROUTES ============
 
+def _company_doc(company_obj: Company) -> dict:
+    """Company insert payload plus the normalized name used for exact lookups"""
+    doc = company_obj.model_dump()
+    doc["name_lower"] = doc["name"].strip().lower()
+    return doc
+
 @api_router.post("/companies", response_model=Company)
 async def create_company(company: CompanyCreate, user_id: str = Depends(get_current_user)):
     company_obj = Company(user_id=user_id, **company.model_dump())
-    await db.companies.insert_one(serialize_doc(company_obj.model_dump()))
+    await db.companies.insert_one(_company_doc(company_obj))
     return company_obj
 
-@api_router.get("/companies", response_model=List[Company])
-async def get_companies(user_id: str = Depends(get_current_user)):
-    companies = await db.companies.find({"user_id": user_id, "is_deleted": {"$ne": True}}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(c) for c in companies]
+@api_router.get("/companies")
+async def get_companies(limit: int = 1000, offset: int = 0, fields: Optional[str] = None,
+                        user_id: str = Depends(get_current_user)):
+    limit = min(max(limit, 1), 1000)
+    companies = await db.companies.find(
+        {"user_id": user_id, "is_deleted": {"$ne": True}},
+        _list_projection(fields, exclude=("name_lower",))
+    ).skip(max(offset, 0)).limit(limit).to_list(limit)
+    return companies
 
 @api_router.get("/companies/{company_id}", response_model=Company)
 async def get_company(company_id: str, user_id: str = Depends(get_current_user)):
     company = await db.companies.find_one({"id": company_id, "user_id": user_id}, {"_id": 0})
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
-    return deserialize_doc(company)
+    return Company.model_construct(**company)
 
 @api_router.delete("/companies/{company_id}")
 async def delete_company(company_id: str, user_id: str = Depends(get_current_user)):
     # Soft delete
     result = await db.companies.update_one(
         {"id": company_id, "user_id": user_id, "is_deleted": {"$ne": True}},
-        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}}
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Company not found")
@@ -510,271 +617,393 @@ async def delete_company(company_id: str, user_id: str = Depends(get_current_use
 @api_router.post("/contacts", response_model=Contact)
 async def create_contact(contact: ContactCreate, user_id: str = Depends(get_current_user)):
     contact_obj = Contact(user_id=user_id, **contact.model_dump())
-    await db.contacts.insert_one(serialize_doc(contact_obj.model_dump()))
+    await db.contacts.insert_one(contact_obj.model_dump())
     return contact_obj
 
-@api_router.get("/contacts", response_model=List[Contact])
-async def get_contacts(user_id: str = Depends(get_current_user)):
-    contacts = await db.contacts.find({"user_id": user_id, "is_deleted": {"$ne": True}}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(c) for c in contacts]
+@api_router.get("/contacts")
+async def get_contacts(limit: int = 1000, offset: int = 0, fields: Optional[str] = None,
+                       user_id: str = Depends(get_current_user)):
+    limit = min(max(limit, 1), 1000)
+    contacts = await db.contacts.find(
+        {"user_id": user_id, "is_deleted": {"$ne": True}}, _list_projection(fields)
+    ).skip(max(offset, 0)).limit(limit).to_list(limit)
+    return contacts
 
 @api_router.delete("/contacts/{contact_id}")
 async def delete_contact(contact_id: str, user_id: str = Depends(get_current_user)):
     # Soft delete
     result = await db.contacts.update_one(
         {"id": contact_id, "user_id": user_id, "is_deleted": {"$ne": True}},
-        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}}
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Contact not found")
     return {"message": "Contact moved to trash", "can_undo": True}
 
+_JOB_STATUSES = ("applied", "interview", "offer", "rejected", "ghosted", "pending")
+
+async def _job_status_stats(user_id: str) -> dict:
+    """Count jobs per status with one server-side $group instead of fetching every doc"""
+    rows = await db.jobs.aggregate([
+        {"$match": {"user_id": user_id}},
+        {"$group": {"_id": "$status", "n": {"$sum": 1}}},
+    ]).to_list(20)
+    counts = {row["_id"]: row["n"] for row in rows}
+    stats = {"total": sum(counts.values())}
+    for status in _JOB_STATUSES:
+        stats[status] = counts.get(status, 0)
+    return stats
+
 # ============ CHAT ROUTES ============
 
+# Per-user LLM config cache. Configs change rarely, so a short TTL saves a
+# Mongo round-trip on every chat turn; updates invalidate their own entry
+_LLM_CONFIG_TTL = 60.0
+_LLM_CONFIG_CACHE_MAX = 10000
+_llm_config_cache = {}
+
+# Write-behind persistence for documents the response doesn't depend on.
+# Keeping a reference stops the loop from garbage-collecting pending tasks.
+_background_writes = set()
+
+def _write_behind(coro):
+    task = asyncio.create_task(coro)
+    _background_writes.add(task)
+    task.add_done_callback(_background_writes.discard)
+
+# Response cache for repeated chat messages. Exact-match on the message text
+# per user; a hit skips the LLM round-trip entirely. 30 min TTL keeps
+# tool-backed answers (job lists, stats) from going too stale. Responses
+# whose run dispatched a mutating tool are never cached: replaying "added
+# it!" without re-running the write would silently drop the mutation.
+_CHAT_CACHE_TTL = 1800.0
+_CHAT_CACHE_MAX = 512
+_READONLY_FUNCTIONS = frozenset((
+    "get_jobs", "get_dashboard_stats", "get_companies", "get_contacts",
+    "parse_job_description",
+))
+_chat_response_cache = {}
+
+@lru_cache(maxsize=1024)
+def _resolve_model(provider: str, model_name: str) -> str:
+    """Full LiteLLM model string for a stored provider/model pair"""
+    if provider == 'openai_compatible':
+        return f"openai/{model_name}"
+    if provider == 'openrouter':
+        # OpenRouter models already include provider (e.g., openai/gpt-4)
+        if '/' not in model_name:
+            model_name = f"openai/{model_name}"
+        return f"openrouter/{model_name}"
+    return f"{provider}/{model_name}"
+
+async def _get_llm_config(user_id: str):
+    now = time.monotonic()
+    entry = _llm_config_cache.get(user_id)
+    if entry is not None and now - entry[0] < _LLM_CONFIG_TTL:
+        return entry[1]
+    config = await db.llm_configs.find_one({"user_id": user_id})
+    if len(_llm_config_cache) >= _LLM_CONFIG_CACHE_MAX:
+        _llm_config_cache.pop(next(iter(_llm_config_cache)))
+    _llm_config_cache[user_id] = (now, config)
+    return config
+
+# Bound every LLM call so a degraded provider cannot pin event-loop slots:
+# at most _LLM_SEM calls in flight, each hard-capped at _LLM_CALL_TIMEOUT,
+# and a base_url that keeps failing is short-circuited with 503 until the
+# breaker window passes instead of queueing doomed requests behind it.
+_LLM_SEM = asyncio.Semaphore(32)
+_LLM_CALL_TIMEOUT = 25.0
+_BREAKER_FAILURES = 5
+_BREAKER_WINDOW = 30.0
+_BREAKER_OPEN = 30.0
+_llm_breaker: dict = {}
+
+async def _guarded_completion(**kwargs):
+    key = kwargs.get("base_url") or kwargs.get("model")
+    now = time.monotonic()
+    state = _llm_breaker.get(key)
+    if state is not None and state.get("open_until", 0.0) > now:
+        raise HTTPException(
+            status_code=503, detail="LLM provider is unavailable, please retry shortly")
+    async with _LLM_SEM:
+        try:
+            response = await asyncio.wait_for(
+                acompletion(timeout=20, **kwargs), timeout=_LLM_CALL_TIMEOUT)
+        except Exception:
+            if state is None or now - state["window_start"] > _BREAKER_WINDOW:
+                state = {"window_start": now, "failures": 0}
+                _llm_breaker[key] = state
+            state["failures"] += 1
+            if state["failures"] >= _BREAKER_FAILURES:
+                state["open_until"] = now + _BREAKER_OPEN
+            raise
+    _llm_breaker.pop(key, None)
+    return response
+
+# Stable system prompt shared by both completion calls; keeping the identical
+# prefix (system + tools) first lets providers apply prompt-prefix caching
+CHAT_SYSTEM_PROMPT = (
+    "You are a helpful career assistant for CareerFlow. You help users track "
+    "their job applications, update statuses, and manage their job search. "
+    "Use the available functions to access and update the user's actual job "
+    "data. Be specific and actionable."
+)
+
+_SYSTEM_MSG = {"role": "system", "content": CHAT_SYSTEM_PROMPT}
+
+# Static function-calling schema for the chat assistant, built once at
+# import time instead of re-allocated on every /chat/send request
+CHAT_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_jobs",
+            "description": "Get list of user's job applications. Can filter by status (pending, applied, interview, offer, rejected, ghosted).",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "status": {
+                        "type": "string",
+                        "enum": ["pending", "applied", "interview", "offer", "rejected", "ghosted", "all"],
+                        "description": "Filter jobs by status. Use 'all' to get all jobs."
+                    }
+                }
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "update_job_status",
+            "description": "Update the status of a job application.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "string",
+                        "description": "The ID of the job to update"
+                    },
+                    "new_status": {
+                        "type": "string",
+                        "enum": ["pending", "applied", "interview", "offer", "rejected", "ghosted"],
+                        "description": "The new status for the job"
+                    }
+                },
+                "required": ["job_id", "new_status"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "add_job",
+            "description": "Add a new job application to track.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string", "description": "Job title"},
+                    "company": {"type": "string", "description": "Company name"},
+                    "location": {"type": "string", "description": "Job location"},
+                    "status": {"type": "string", "enum": ["pending", "applied", "interview"], "description": "Initial status"},
+                    "notes": {"type": "string", "description": "Any notes about the job"}
+                },
+                "required": ["title", "company"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_dashboard_stats",
+            "description": "Get statistics about job applications (total, by status).",
+            "parameters": {"type": "object", "properties": {}}
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "create_company",
+            "description": "Add a new company to track.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Company name"},
+                    "about": {"type": "string", "description": "About the company"},
+                    "visa_sponsor": {"type": "boolean", "description": "Does company sponsor visas"},
+                    "stem_support": {"type": "boolean", "description": "STEM-OPT support"}
+                },
+                "required": ["name"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "create_contact",
+            "description": "Add a new contact to your network.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Contact's name"},
+                    "email": {"type": "string", "description": "Email address"},
+                    "company": {"type": "string", "description": "Company name"},
+                    "role": {"type": "string", "description": "Their role/title"},
+                    "notes": {"type": "string", "description": "Notes about the contact"}
+                },
+                "required": ["name"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "create_knowledge",
+            "description": "Save an article, note, or learning to knowledge base.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string", "description": "Title of the article/note"},
+                    "content": {"type": "string", "description": "The content"},
+                    "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags for organization"}
+                },
+                "required": ["title", "content"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "parse_job_description",
+            "description": "Parse a job description to extract skills, requirements, and other details.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "description": {"type": "string", "description": "The job description text"}
+                },
+                "required": ["description"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_companies",
+            "description": "Get list of tracked companies.",
+            "parameters": {"type": "object", "properties": {}}
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_contacts",
+            "description": "Get list of contacts in your network.",
+            "parameters": {"type": "object", "properties": {}}
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "research_company",
+            "description": "Research a company by scraping their website to get information about what they do, their culture, STEM-OPT support, visa sponsorship, etc. Updates the company profile with the researched info.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "company_name": {"type": "string", "description": "Name of the company to research"},
+                    "company_website": {"type": "string", "description": "Company website URL (e.g., https://company.com). Optional if you don't know it."}
+                },
+                "required": ["company_name"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "update_company",
+            "description": "Update an existing company's details like about, visa sponsorship status, STEM-OPT support, etc.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "company_id": {"type": "string", "description": "ID of the company to update"},
+                    "about": {"type": "string", "description": "About the company"},
+                    "visa_sponsor": {"type": "boolean", "description": "Does company sponsor visas"},
+                    "stem_support": {"type": "boolean", "description": "STEM-OPT support"},
+                    "employee_count": {"type": "string", "description": "Approximate employee count"},
+                    "research": {"type": "string", "description": "Research notes about the company"},
+                    "user_comments": {"type": "string", "description": "User's personal notes"}
+                },
+                "required": ["company_id"]
+            }
+        }
+    }
+]
+
 @api_router.post("/chat/send")
 async def send_chat_message(msg: ChatMessageCreate, user_id: str = Depends(get_current_user)):
-    session_id = msg.session_id or str(uuid.uuid4())
+    session_id = msg.session_id or _new_id()
     
     # Get user's LLM config
-    llm_config = await db.llm_configs.find_one({"user_id": user_id})
+    llm_config = await _get_llm_config(user_id)
     
     if not llm_config:
         raise HTTPException(status_code=400, detail="Please configure your LLM settings first")
     
-    try:
-        # Define tools for function calling
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_jobs",
-                    "description": "Get list of user's job applications. Can filter by status (pending, applied, interview, offer, rejected, ghosted).",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "status": {
-                                "type": "string",
-                                "enum": ["pending", "applied", "interview", "offer", "rejected", "ghosted", "all"],
-                                "description": "Filter jobs by status. Use 'all' to get all jobs."
-                            }
-                        }
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "update_job_status",
-                    "description": "Update the status of a job application.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "job_id": {
-                                "type": "string",
-                                "description": "The ID of the job to update"
-                            },
-                            "new_status": {
-                                "type": "string",
-                                "enum": ["pending", "applied", "interview", "offer", "rejected", "ghosted"],
-                                "description": "The new status for the job"
-                            }
-                        },
-                        "required": ["job_id", "new_status"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "add_job",
-                    "description": "Add a new job application to track.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string", "description": "Job title"},
-                            "company": {"type": "string", "description": "Company name"},
-                            "location": {"type": "string", "description": "Job location"},
-                            "status": {"type": "string", "enum": ["pending", "applied", "interview"], "description": "Initial status"},
-                            "notes": {"type": "string", "description": "Any notes about the job"}
-                        },
-                        "required": ["title", "company"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_dashboard_stats",
-                    "description": "Get statistics about job applications (total, by status).",
-                    "parameters": {"type": "object", "properties": {}}
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "create_company",
-                    "description": "Add a new company to track.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string", "description": "Company name"},
-                            "about": {"type": "string", "description": "About the company"},
-                            "visa_sponsor": {"type": "boolean", "description": "Does company sponsor visas"},
-                            "stem_support": {"type": "boolean", "description": "STEM-OPT support"}
-                        },
-                        "required": ["name"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "create_contact",
-                    "description": "Add a new contact to your network.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string", "description": "Contact's name"},
-                            "email": {"type": "string", "description": "Email address"},
-                            "company": {"type": "string", "description": "Company name"},
-                            "role": {"type": "string", "description": "Their role/title"},
-                            "notes": {"type": "string", "description": "Notes about the contact"}
-                        },
-                        "required": ["name"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "create_knowledge",
-                    "description": "Save an article, note, or learning to knowledge base.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string", "description": "Title of the article/note"},
-                            "content": {"type": "string", "description": "The content"},
-                            "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags for organization"}
-                        },
-                        "required": ["title", "content"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "parse_job_description",
-                    "description": "Parse a job description to extract skills, requirements, and other details.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "description": {"type": "string", "description": "The job description text"}
-                        },
-                        "required": ["description"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_companies",
-                    "description": "Get list of tracked companies.",
-                    "parameters": {"type": "object", "properties": {}}
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_contacts",
-                    "description": "Get list of contacts in your network.",
-                    "parameters": {"type": "object", "properties": {}}
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "research_company",
-                    "description": "Research a company by scraping their website to get information about what they do, their culture, STEM-OPT support, visa sponsorship, etc. Updates the company profile with the researched info.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "company_name": {"type": "string", "description": "Name of the company to research"},
-                            "company_website": {"type": "string", "description": "Company website URL (e.g., https://company.com). Optional if you don't know it."}
-                        },
-                        "required": ["company_name"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "update_company",
-                    "description": "Update an existing company's details like about, visa sponsorship status, STEM-OPT support, etc.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "company_id": {"type": "string", "description": "ID of the company to update"},
-                            "about": {"type": "string", "description": "About the company"},
-                            "visa_sponsor": {"type": "boolean", "description": "Does company sponsor visas"},
-                            "stem_support": {"type": "boolean", "description": "STEM-OPT support"},
-                            "employee_count": {"type": "string", "description": "Approximate employee count"},
-                            "research": {"type": "string", "description": "Research notes about the company"},
-                            "user_comments": {"type": "string", "description": "User's personal notes"}
-                        },
-                        "required": ["company_id"]
-                    }
-                }
-            }
-        ]
-        
-        # Call LiteLLM with tools
-        model_name = llm_config['model']
-        if llm_config['provider'] == 'openai_compatible':
-            model_prefix = "openai/"
-        elif llm_config['provider'] == 'openrouter':
-            # OpenRouter models already include provider (e.g., openai/gpt-4)
-            model_prefix = "openrouter/"
-            # If user included provider in model name, use as-is, otherwise add prefix
-            if '/' not in model_name:
-                model_name = f"openai/{model_name}"  # Default to openai models
-        else:
-            model_prefix = f"{llm_config['provider']}/"
-        
-        response = await acompletion(
-            model=f"{model_prefix}{model_name}",
-            messages=[
-                {"role": "system", "content": "You are a helpful career assistant for CareerFlow. You help users track their job applications, update statuses, and manage their job search. Use the available functions to access and update the user's actual job data. Be specific and actionable."},
-                {"role": "user", "content": msg.message}
-            ],
-            tools=tools,
-            api_key=llm_config.get('api_key') or 'dummy',
-            base_url=llm_config.get('base_url')
+    cached = _chat_response_cache.get((user_id, msg.message))
+    if cached is not None and time.monotonic() - cached[0] < _CHAT_CACHE_TTL:
+        chat_obj = ChatMessage(
+            user_id=user_id,
+            session_id=session_id,
+            message=msg.message,
+            response=cached[1]
         )
+        _write_behind(db.chat_messages.insert_one(chat_obj.model_dump()))
+        return {"response": cached[1], "session_id": session_id}
+    
+    try:
+        # Build the request kwargs shared by both completion calls once
+        common_kwargs = {
+            "model": _resolve_model(llm_config['provider'], llm_config['model']),
+            "tools": CHAT_TOOLS,
+            "api_key": llm_config.get('api_key') or 'dummy',
+            "base_url": llm_config.get('base_url'),
+        }
+        user_msg = {"role": "user", "content": msg.message}
+
+        response = await _guarded_completion(
+            messages=[_SYSTEM_MSG, user_msg], **common_kwargs)
         
-        # Check if AI wants to call a function
-        if response.choices[0].message.tool_calls:
-            tool_call = response.choices[0].message.tool_calls[0]
-            function_name = tool_call.function.name
-            function_args = json.loads(tool_call.function.arguments)
-            
-            # Execute the function
-            function_result = await execute_function(function_name, function_args, user_id)
+        # Check if AI wants to call functions
+        tool_calls = response.choices[0].message.tool_calls
+        if tool_calls:
+            # Execute every requested function concurrently; independent
+            # lookups (e.g. get_jobs + get_companies) overlap their I/O
+            results = await asyncio.gather(*[
+                execute_function(tc.function.name, _loads(tc.function.arguments), user_id)
+                for tc in tool_calls
+            ])
             
-            # Call LLM again with function result
-            response = await acompletion(
-                model=f"{model_prefix}{model_name}",
-                messages=[
-                    {"role": "system", "content": "You are a helpful career assistant for CareerFlow. You help users track their job applications, update statuses, and manage their job search. Use the available functions to access and update the user's actual job data. Be specific and actionable."},
-                    {"role": "user", "content": msg.message},
-                    {"role": "assistant", "content": None, "tool_calls": [{"id": tool_call.id, "type": "function", "function": {"name": function_name, "arguments": tool_call.function.arguments}}]},
-                    {"role": "tool", "tool_call_id": tool_call.id, "name": function_name, "content": json.dumps(function_result)}
-                ],
-                tools=tools,
-                api_key=llm_config.get('api_key') or 'dummy',
-                base_url=llm_config.get('base_url')
+            # Call LLM again with all function results
+            messages = [
+                _SYSTEM_MSG,
+                user_msg,
+                {"role": "assistant", "content": None, "tool_calls": [
+                    {"id": tc.id, "type": "function", "function": {"name": tc.function.name, "arguments": tc.function.arguments}}
+                    for tc in tool_calls
+                ]}
+            ]
+            messages.extend(
+                {"role": "tool", "tool_call_id": tc.id, "name": tc.function.name, "content": _dump_doc(result).decode()}
+                for tc, result in zip(tool_calls, results)
             )
+            response = await _guarded_completion(messages=messages, **common_kwargs)
         
         response_text = response.choices[0].message.content
+
+        cacheable = not tool_calls or all(
+            tc.function.name in _READONLY_FUNCTIONS for tc in tool_calls)
+        if cacheable:
+            if len(_chat_response_cache) >= _CHAT_CACHE_MAX:
+                _chat_response_cache.pop(next(iter(_chat_response_cache)))
+            _chat_response_cache[(user_id, msg.message)] = (time.monotonic(), response_text)
         
         # Save to database
         chat_obj = ChatMessage(
@@ -783,210 +1012,205 @@ async def send_chat_message(msg: ChatMessageCreate, user_id: str = Depends(get_c
             message=msg.message,
             response=response_text
         )
-        await db.chat_messages.insert_one(serialize_doc(chat_obj.model_dump()))
+        _write_behind(db.chat_messages.insert_one(chat_obj.model_dump()))
         
         return {"response": response_text, "session_id": session_id}
-    
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Chat error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
 
-async def execute_function(function_name: str, arguments: dict, user_id: str):
-    """Execute a function called by the AI"""
-    
-    if function_name == "get_jobs":
-        status_filter = arguments.get("status", "all")
-        query = {"user_id": user_id}
-        if status_filter != "all":
-            query["status"] = status_filter
-        
-        jobs = await db.jobs.find(query, {"_id": 0}).to_list(100)
-        return [
-            {
-                "id": job["id"],
-                "title": job["title"],
-                "company": job["company"],
-                "status": job["status"],
-                "location": job.get("location"),
-                "applied_date": job.get("applied_date"),
-                "notes": job.get("notes")
-            }
-            for job in jobs
-        ]
-    
-    elif function_name == "update_job_status":
-        job_id = arguments["job_id"]
-        new_status = arguments["new_status"]
-        
-        result = await db.jobs.update_one(
-            {"id": job_id, "user_id": user_id},
-            {"$set": {"status": new_status, "updated_at": datetime.now(timezone.utc).isoformat()}}
-        )
-        
-        if result.modified_count > 0:
-            return {"success": True, "message": f"Updated job status to {new_status}"}
-        else:
-            return {"success": False, "message": "Job not found or no changes made"}
-    
-    elif function_name == "add_job":
-        job_data = JobCreate(**arguments)
-        job_obj = Job(user_id=user_id, **job_data.model_dump())
-        await db.jobs.insert_one(serialize_doc(job_obj.model_dump()))
-        
-        return {
-            "success": True,
-            "job_id": job_obj.id,
-            "message": f"Added {job_obj.title} at {job_obj.company}"
-        }
-    
-    elif function_name == "get_dashboard_stats":
-        jobs = await db.jobs.find({"user_id": user_id}, {"_id": 0}).to_list(1000)
-        stats = {
-            "total": len(jobs),
-            "applied": len([j for j in jobs if j['status'] == 'applied']),
-            "interview": len([j for j in jobs if j['status'] == 'interview']),
-            "offer": len([j for j in jobs if j['status'] == 'offer']),
-            "rejected": len([j for j in jobs if j['status'] == 'rejected']),
-            "ghosted": len([j for j in jobs if j['status'] == 'ghosted']),
-            "pending": len([j for j in jobs if j['status'] == 'pending'])
-        }
-        return stats
+async def _fn_get_jobs(arguments: dict, user_id: str):
+    status_filter = arguments.get("status", "all")
+    query = {"user_id": user_id}
+    if status_filter != "all":
+        query["status"] = status_filter
     
-    elif function_name == "create_company":
-        company_data = CompanyCreate(**arguments)
-        company_obj = Company(user_id=user_id, **company_data.model_dump())
-        await db.companies.insert_one(serialize_doc(company_obj.model_dump()))
-        return {"success": True, "company_id": company_obj.id, "message": f"Added company: {company_obj.name}"}
+    # project in Mongo so description and other large blobs never leave the DB
+    return await db.jobs.find(query, {
+        "_id": 0, "id": 1, "title": 1, "company": 1, "status": 1,
+        "location": 1, "applied_date": 1, "notes": 1
+    }).to_list(100)
+
+async def _fn_update_job_status(arguments: dict, user_id: str):
+    job_id = arguments["job_id"]
+    new_status = arguments["new_status"]
     
-    elif function_name == "create_contact":
-        # If company name is provided, try to find company_id
-        company_name = arguments.pop("company", None)
-        company_id = None
-        if company_name:
-            company = await db.companies.find_one({"user_id": user_id, "name": company_name})
-            if company:
-                company_id = company["id"]
-        
-        contact_data = ContactCreate(**arguments, company_id=company_id)
-        contact_obj = Contact(user_id=user_id, **contact_data.model_dump())
-        await db.contacts.insert_one(serialize_doc(contact_obj.model_dump()))
-        return {"success": True, "contact_id": contact_obj.id, "message": f"Added contact: {contact_obj.name}"}
+    result = await db.jobs.update_one(
+        {"id": job_id, "user_id": user_id},
+        {"$set": {"status": new_status, "updated_at": datetime.now(timezone.utc)}}
+    )
     
-    elif function_name == "create_knowledge":
-        tags = arguments.get("tags", [])
-        knowledge_data = KnowledgeCreate(
-            title=arguments["title"],
-            content=arguments["content"],
-            tags=tags
-        )
-        knowledge_obj = Knowledge(user_id=user_id, **knowledge_data.model_dump())
-        await db.knowledge.insert_one(serialize_doc(knowledge_obj.model_dump()))
-        return {"success": True, "knowledge_id": knowledge_obj.id, "message": f"Saved to knowledge base: {knowledge_obj.title}"}
+    if result.modified_count > 0:
+        return {"success": True, "message": f"Updated job status to {new_status}"}
+    else:
+        return {"success": False, "message": "Job not found or no changes made"}
+
+async def _fn_add_job(arguments: dict, user_id: str):
+    job_data = JobCreate(**arguments)
+    job_obj = Job(user_id=user_id, **job_data.model_dump())
+    await db.jobs.insert_one(job_obj.model_dump())
     
-    elif function_name == "parse_job_description":
-        from ai_features import parse_job_description as parse_desc
-        description = arguments["description"]
-        result = parse_desc(description)
-        return result
+    return {
+        "success": True,
+        "job_id": job_obj.id,
+        "message": f"Added {job_obj.title} at {job_obj.company}"
+    }
+
+async def _fn_get_dashboard_stats(arguments: dict, user_id: str):
+    return await _job_status_stats(user_id)
+
+async def _fn_create_company(arguments: dict, user_id: str):
+    company_data = CompanyCreate(**arguments)
+    company_obj = Company(user_id=user_id, **company_data.model_dump())
+    await db.companies.insert_one(_company_doc(company_obj))
+    return {"success": True, "company_id": company_obj.id, "message": f"Added company: {company_obj.name}"}
+
+async def _fn_create_contact(arguments: dict, user_id: str):
+    # If company name is provided, try to find company_id
+    company_name = arguments.pop("company", None)
+    company_id = None
+    if company_name:
+        company = await db.companies.find_one({"user_id": user_id, "name": company_name})
+        if company:
+            company_id = company["id"]
+    
+    contact_data = ContactCreate(**arguments, company_id=company_id)
+    contact_obj = Contact(user_id=user_id, **contact_data.model_dump())
+    await db.contacts.insert_one(contact_obj.model_dump())
+    return {"success": True, "contact_id": contact_obj.id, "message": f"Added contact: {contact_obj.name}"}
+
+async def _fn_create_knowledge(arguments: dict, user_id: str):
+    tags = arguments.get("tags", [])
+    knowledge_data = KnowledgeCreate(
+        title=arguments["title"],
+        content=arguments["content"],
+        tags=tags
+    )
+    knowledge_obj = Knowledge(user_id=user_id, **knowledge_data.model_dump())
+    await db.knowledge.insert_one(knowledge_obj.model_dump())
+    _bump_kb_version(user_id)
+    _write_behind(_store_knowledge_embedding(
+        knowledge_obj.id, knowledge_obj.title, knowledge_obj.content))
+    return {"success": True, "knowledge_id": knowledge_obj.id, "message": f"Saved to knowledge base: {knowledge_obj.title}"}
+
+async def _fn_parse_job_description(arguments: dict, user_id: str):
+    from ai_features import parse_job_description as parse_desc
+    description = arguments["description"]
+    result = parse_desc(description)
+    return result
+
+async def _fn_get_companies(arguments: dict, user_id: str):
+    return await db.companies.find({"user_id": user_id}, {
+        "_id": 0, "id": 1, "name": 1, "visa_sponsor": 1, "stem_support": 1
+    }).to_list(100)
+
+async def _fn_get_contacts(arguments: dict, user_id: str):
+    return await db.contacts.find({"user_id": user_id}, {
+        "_id": 0, "id": 1, "name": 1, "email": 1, "role": 1
+    }).to_list(100)
+
+async def _fn_research_company(arguments: dict, user_id: str):
+    company_name = arguments["company_name"]
+    company_website = arguments.get("company_website", "")
+    
+    # Find-or-create and the research timestamp in one atomic upsert; the
+    # exact match on the normalized name uses the (user_id, name_lower)
+    # index, with the old regex scan kept for docs that predate name_lower.
+    # Concurrent calls can no longer race each other into duplicates.
+    name_lower = company_name.strip().lower()
+    new_doc = _company_doc(Company(user_id=user_id, name=company_name))
+    new_doc.pop("research", None)
+    research_note = (
+        f"Research initiated on {datetime.now(timezone.utc).strftime('%Y-%m-%d')}. "
+        "Use the links to gather info, then tell me what you found and I'll update the profile.")
+    company = await db.companies.find_one_and_update(
+        {"user_id": user_id,
+         "$or": [{"name_lower": name_lower},
+                 {"name": {"$regex": company_name, "$options": "i"}}]},
+        {"$setOnInsert": new_doc, "$set": {"research": research_note}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+        projection={"_id": 0},
+    )
+
+    # Build research info structure
+    research_info = {
+        "company_name": company_name,
+        "company_id": company["id"],
+        "existing_info": {
+            "about": company.get("about"),
+            "visa_sponsor": company.get("visa_sponsor"),
+            "stem_support": company.get("stem_support"),
+            "employee_count": company.get("employee_count"),
+            "research": company.get("research")
+        },
+        "suggestions": []
+    }
     
-    elif function_name == "get_companies":
-        companies = await db.companies.find({"user_id": user_id}, {"_id": 0}).to_list(100)
-        return [
-            {
-                "id": c["id"],
-                "name": c["name"],
-                "visa_sponsor": c.get("visa_sponsor", False),
-                "stem_support": c.get("stem_support", False)
-            }
-            for c in companies
-        ]
+    # Provide search suggestions
+    search_query = company_name.replace(" ", "+")
+    research_info["suggestions"] = [
+        f"Search Google: https://www.google.com/search?q={search_query}+careers",
+        f"Search for visa sponsorship: https://www.google.com/search?q={search_query}+h1b+visa+sponsorship",
+        f"Check Glassdoor: https://www.glassdoor.com/Search/results.htm?keyword={search_query}",
+        f"Check LinkedIn: https://www.linkedin.com/company/{company_name.lower().replace(' ', '-')}"
+    ]
+    
+    if company_website:
+        research_info["suggestions"].insert(0, f"Company website: {company_website}")
+
+    return {
+        "success": True,
+        "company_id": company["id"],
+        "company_name": company_name,
+        "current_info": research_info["existing_info"],
+        "research_links": research_info["suggestions"],
+        "message": f"I've prepared research links for {company_name}. Tell me what you find about their visa sponsorship, STEM-OPT support, company size, etc., and I'll update the company profile."
+    }
+
+async def _fn_update_company(arguments: dict, user_id: str):
+    company_id = arguments.pop("company_id")
     
-    elif function_name == "get_contacts":
-        contacts = await db.contacts.find({"user_id": user_id}, {"_id": 0}).to_list(100)
-        return [
-            {
-                "id": c["id"],
-                "name": c["name"],
-                "email": c.get("email"),
-                "role": c.get("role")
-            }
-            for c in contacts
-        ]
+    # Filter out None values
+    update_data = {k: v for k, v in arguments.items() if v is not None}
     
-    elif function_name == "research_company":
-        company_name = arguments["company_name"]
-        company_website = arguments.get("company_website", "")
-        
-        # Try to find or create the company
-        company = await db.companies.find_one({"user_id": user_id, "name": {"$regex": company_name, "$options": "i"}})
-        
-        if not company:
-            # Create new company
-            company_obj = Company(user_id=user_id, name=company_name)
-            await db.companies.insert_one(serialize_doc(company_obj.model_dump()))
-            company = company_obj.model_dump()
-        
-        # Build research info structure
-        research_info = {
-            "company_name": company_name,
-            "company_id": company["id"],
-            "existing_info": {
-                "about": company.get("about"),
-                "visa_sponsor": company.get("visa_sponsor"),
-                "stem_support": company.get("stem_support"),
-                "employee_count": company.get("employee_count"),
-                "research": company.get("research")
-            },
-            "suggestions": []
-        }
-        
-        # Provide search suggestions
-        search_query = company_name.replace(" ", "+")
-        research_info["suggestions"] = [
-            f"Search Google: https://www.google.com/search?q={search_query}+careers",
-            f"Search for visa sponsorship: https://www.google.com/search?q={search_query}+h1b+visa+sponsorship",
-            f"Check Glassdoor: https://www.glassdoor.com/Search/results.htm?keyword={search_query}",
-            f"Check LinkedIn: https://www.linkedin.com/company/{company_name.lower().replace(' ', '-')}"
-        ]
-        
-        if company_website:
-            research_info["suggestions"].insert(0, f"Company website: {company_website}")
-        
-        # Update company with research timestamp
-        await db.companies.update_one(
-            {"id": company["id"], "user_id": user_id},
-            {"$set": {"research": f"Research initiated on {datetime.now(timezone.utc).strftime('%Y-%m-%d')}. Use the links to gather info, then tell me what you found and I'll update the profile."}}
+    if update_data:
+        result = await db.companies.update_one(
+            {"id": company_id, "user_id": user_id},
+            {"$set": update_data}
         )
         
-        return {
-            "success": True,
-            "company_id": company["id"],
-            "company_name": company_name,
-            "current_info": research_info["existing_info"],
-            "research_links": research_info["suggestions"],
-            "message": f"I've prepared research links for {company_name}. Tell me what you find about their visa sponsorship, STEM-OPT support, company size, etc., and I'll update the company profile."
-        }
-    
-    elif function_name == "update_company":
-        company_id = arguments.pop("company_id")
-        
-        # Filter out None values
-        update_data = {k: v for k, v in arguments.items() if v is not None}
-        
-        if update_data:
-            result = await db.companies.update_one(
-                {"id": company_id, "user_id": user_id},
-                {"$set": update_data}
-            )
-            
-            if result.modified_count > 0:
-                return {"success": True, "message": f"Updated company successfully"}
-            else:
-                return {"success": False, "message": "Company not found or no changes made"}
-        
-        return {"success": False, "message": "No update data provided"}
-    
-    return {"error": "Unknown function"}
+        if result.modified_count > 0:
+            return {"success": True, "message": f"Updated company successfully"}
+        else:
+            return {"success": False, "message": "Company not found or no changes made"}
+    
+    return {"success": False, "message": "No update data provided"}
+
+_FUNCTION_HANDLERS = {
+    "get_jobs": _fn_get_jobs,
+    "update_job_status": _fn_update_job_status,
+    "add_job": _fn_add_job,
+    "get_dashboard_stats": _fn_get_dashboard_stats,
+    "create_company": _fn_create_company,
+    "create_contact": _fn_create_contact,
+    "create_knowledge": _fn_create_knowledge,
+    "parse_job_description": _fn_parse_job_description,
+    "get_companies": _fn_get_companies,
+    "get_contacts": _fn_get_contacts,
+    "research_company": _fn_research_company,
+    "update_company": _fn_update_company,
+}
+
+async def execute_function(function_name: str, arguments: dict, user_id: str):
+    """Execute a function called by the AI via one dict dispatch"""
+    handler = _FUNCTION_HANDLERS.get(function_name)
+    if handler is None:
+        return {"error": "Unknown function"}
+    return await handler(arguments, user_id)
 
 @api_router.get("/chat/history")
 async def get_chat_history(session_id: Optional[str] = None, user_id: str = Depends(get_current_user)):
@@ -994,8 +1218,8 @@ async def get_chat_history(session_id: Optional[str] = None, user_id: str = Depe
     if session_id:
         query["session_id"] = session_id
     
-    messages = await db.chat_messages.find(query, {"_id": 0}).sort("timestamp", 1).to_list(1000)
-    return [deserialize_doc(msg) for msg in messages]
+    cursor = db.chat_messages.find(query, {"_id": 0}).sort("timestamp", 1).limit(1000)
+    return StreamingResponse(_stream_json_array(cursor), media_type="application/json")
 
 @api_router.delete("/chat/clear")
 async def clear_chat_history(session_id: Optional[str] = None, user_id: str = Depends(get_current_user)):
@@ -1011,11 +1235,12 @@ async def clear_chat_history(session_id: Optional[str] = None, user_id: str = De
 
 @api_router.post("/llm-config", response_model=LLMConfig)
 async def create_llm_config(config: LLMConfigCreate, user_id: str = Depends(get_current_user)):
-    # Delete existing config
-    await db.llm_configs.delete_many({"user_id": user_id})
-    
     config_obj = LLMConfig(user_id=user_id, **config.model_dump())
-    await db.llm_configs.insert_one(serialize_doc(config_obj.model_dump()))
+    # One atomic upsert replaces the old delete + insert round trips
+    await db.llm_configs.replace_one(
+        {"user_id": user_id}, config_obj.model_dump(), upsert=True
+    )
+    _llm_config_cache.pop(user_id, None)
     return config_obj
 
 @api_router.get("/llm-config")
@@ -1023,31 +1248,31 @@ async def get_llm_config(user_id: str = Depends(get_current_user)):
     config = await db.llm_configs.find_one({"user_id": user_id}, {"_id": 0})
     if not config:
         return None
-    return deserialize_doc(config)
+    return config
 
 # ============ TODOS ROUTES ============
 
 @api_router.post("/todos", response_model=Todo)
 async def create_todo(todo: TodoCreate, user_id: str = Depends(get_current_user)):
     todo_obj = Todo(user_id=user_id, **todo.model_dump())
-    await db.todos.insert_one(serialize_doc(todo_obj.model_dump()))
+    await db.todos.insert_one(todo_obj.model_dump())
     return todo_obj
 
-@api_router.get("/todos", response_model=List[Todo])
+@api_router.get("/todos")
 async def get_todos(user_id: str = Depends(get_current_user)):
-    todos = await db.todos.find({"user_id": user_id, "is_deleted": {"$ne": True}}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(t) for t in todos]
+    cursor = db.todos.find({"user_id": user_id, "is_deleted": {"$ne": True}}, {"_id": 0}).limit(1000)
+    return StreamingResponse(_stream_json_array(cursor), media_type="application/json")
 
 @api_router.put("/todos/{todo_id}")
 async def toggle_todo(todo_id: str, user_id: str = Depends(get_current_user)):
-    todo = await db.todos.find_one({"id": todo_id, "user_id": user_id})
-    if not todo:
-        raise HTTPException(status_code=404, detail="Todo not found")
-    
-    await db.todos.update_one(
-        {"id": todo_id},
-        {"$set": {"completed": not todo.get('completed', False)}}
+    # Pipeline update flips completed atomically in one round-trip, so
+    # concurrent toggles can't lose an update
+    result = await db.todos.update_one(
+        {"id": todo_id, "user_id": user_id},
+        [{"$set": {"completed": {"$not": ["$completed"]}}}]
     )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Todo not found")
     return {"message": "Todo updated"}
 
 @api_router.delete("/todos/{todo_id}")
@@ -1055,7 +1280,7 @@ async def delete_todo(todo_id: str, user_id: str = Depends(get_current_user)):
     # Soft delete
     result = await db.todos.update_one(
         {"id": todo_id, "user_id": user_id, "is_deleted": {"$ne": True}},
-        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}}
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Todo not found")
@@ -1063,26 +1288,53 @@ async def delete_todo(todo_id: str, user_id: str = Depends(get_current_user)):
 
 # ============ KNOWLEDGE ROUTES ============
 
+# Per-user cache of the live knowledge list, validated by a version counter
+# that every knowledge write bumps: repeat searches skip the Mongo round trip
+# entirely, and the embedding matrix behind them is already cached
+# incrementally inside ai_features.KnowledgeIndex (float16 storage)
+_KB_CACHE_MAX = 256
+_kb_versions: dict = {}
+_kb_cache: dict = {}
+
+def _bump_kb_version(user_id: str):
+    _kb_versions[user_id] = _kb_versions.get(user_id, 0) + 1
+    _kb_cache.pop(user_id, None)
+
+async def _store_knowledge_embedding(knowledge_id: str, title: str, content: str):
+    # Embed once at create time so knowledge-search never re-encodes the
+    # item; runs write-behind because model warmup can take seconds
+    embedding = await asyncio.to_thread(embed_knowledge_item, title, content)
+    if embedding is not None:
+        await db.knowledge.update_one(
+            {"id": knowledge_id}, {"$set": {"embedding": embedding}})
+
 @api_router.post("/knowledge", response_model=Knowledge)
 async def create_knowledge(knowledge: KnowledgeCreate, user_id: str = Depends(get_current_user)):
     knowledge_obj = Knowledge(user_id=user_id, **knowledge.model_dump())
-    await db.knowledge.insert_one(serialize_doc(knowledge_obj.model_dump()))
+    await db.knowledge.insert_one(knowledge_obj.model_dump())
+    _bump_kb_version(user_id)
+    _write_behind(_store_knowledge_embedding(
+        knowledge_obj.id, knowledge_obj.title, knowledge_obj.content))
     return knowledge_obj
 
-@api_router.get("/knowledge", response_model=List[Knowledge])
+@api_router.get("/knowledge")
 async def get_knowledge(user_id: str = Depends(get_current_user)):
-    knowledge = await db.knowledge.find({"user_id": user_id, "is_deleted": {"$ne": True}}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(k) for k in knowledge]
+    # embedding is an internal 384-float vector; never ship it in lists
+    cursor = db.knowledge.find(
+        {"user_id": user_id, "is_deleted": {"$ne": True}},
+        {"_id": 0, "embedding": 0}).limit(1000)
+    return StreamingResponse(_stream_json_array(cursor), media_type="application/json")
 
 @api_router.delete("/knowledge/{knowledge_id}")
 async def delete_knowledge(knowledge_id: str, user_id: str = Depends(get_current_user)):
     # Soft delete
     result = await db.knowledge.update_one(
         {"id": knowledge_id, "user_id": user_id, "is_deleted": {"$ne": True}},
-        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}}
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Knowledge not found")
+    _bump_kb_version(user_id)
     return {"message": "Knowledge moved to trash", "can_undo": True}
 
 # ============ PROMPTS ROUTES ============
@@ -1090,13 +1342,13 @@ async def delete_knowledge(knowledge_id: str, user_id: str = Depends(get_current
 @api_router.post("/prompts", response_model=Prompt)
 async def create_prompt(prompt: PromptCreate, user_id: str = Depends(get_current_user)):
     prompt_obj = Prompt(user_id=user_id, **prompt.model_dump())
-    await db.prompts.insert_one(serialize_doc(prompt_obj.model_dump()))
+    await db.prompts.insert_one(prompt_obj.model_dump())
     return prompt_obj
 
-@api_router.get("/prompts", response_model=List[Prompt])
+@api_router.get("/prompts")
 async def get_prompts(user_id: str = Depends(get_current_user)):
-    prompts = await db.prompts.find({"user_id": user_id}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(p) for p in prompts]
+    cursor = db.prompts.find({"user_id": user_id}, {"_id": 0}).limit(1000)
+    return StreamingResponse(_stream_json_array(cursor), media_type="application/json")
 
 @api_router.delete("/prompts/{prompt_id}")
 async def delete_prompt(prompt_id: str, user_id: str = Depends(get_current_user)):
@@ -1110,13 +1362,13 @@ async def delete_prompt(prompt_id: str, user_id: str = Depends(get_current_user)
 @api_router.post("/portals", response_model=JobPortal)
 async def create_portal(portal: JobPortalCreate, user_id: str = Depends(get_current_user)):
     portal_obj = JobPortal(user_id=user_id, **portal.model_dump())
-    await db.portals.insert_one(serialize_doc(portal_obj.model_dump()))
+    await db.portals.insert_one(portal_obj.model_dump())
     return portal_obj
 
-@api_router.get("/portals", response_model=List[JobPortal])
+@api_router.get("/portals")
 async def get_portals(user_id: str = Depends(get_current_user)):
-    portals = await db.portals.find({"user_id": user_id}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(p) for p in portals]
+    cursor = db.portals.find({"user_id": user_id}, {"_id": 0}).limit(1000)
+    return StreamingResponse(_stream_json_array(cursor), media_type="application/json")
 
 @api_router.delete("/portals/{portal_id}")
 async def delete_portal(portal_id: str, user_id: str = Depends(get_current_user)):
@@ -1130,15 +1382,15 @@ async def delete_portal(portal_id: str, user_id: str = Depends(get_current_user)
 @api_router.post("/reminders", response_model=Reminder)
 async def create_reminder(reminder: ReminderCreate, user_id: str = Depends(get_current_user)):
     reminder_obj = Reminder(user_id=user_id, **reminder.model_dump())
-    await db.reminders.insert_one(serialize_doc(reminder_obj.model_dump()))
+    await db.reminders.insert_one(reminder_obj.model_dump())
     return reminder_obj
 
-@api_router.get("/reminders", response_model=List[Reminder])
+@api_router.get("/reminders")
 async def get_reminders(user_id: str = Depends(get_current_user)):
-    reminders = await db.reminders.find({"user_id": user_id, "is_deleted": {"$ne": True}}, {"_id": 0}).sort("reminder_date", 1).to_list(1000)
-    return [deserialize_doc(r) for r in reminders]
+    cursor = db.reminders.find({"user_id": user_id, "is_deleted": {"$ne": True}}, {"_id": 0}).sort("reminder_date", 1).limit(1000)
+    return StreamingResponse(_stream_json_array(cursor), media_type="application/json")
 
-@api_router.get("/reminders/upcoming", response_model=List[Reminder])
+@api_router.get("/reminders/upcoming")
 async def get_upcoming_reminders(user_id: str = Depends(get_current_user)):
     """Get upcoming reminders (not completed, date <= 7 days from now)"""
     future_date = datetime.now(timezone.utc) + timedelta(days=7)
@@ -1146,9 +1398,9 @@ async def get_upcoming_reminders(user_id: str = Depends(get_current_user)):
         "user_id": user_id,
         "completed": False,
         "is_deleted": {"$ne": True},
-        "reminder_date": {"$lte": future_date.isoformat()}
+        "reminder_date": {"$lte": future_date}
     }, {"_id": 0}).sort("reminder_date", 1).to_list(100)
-    return [deserialize_doc(r) for r in reminders]
+    return reminders
 
 @api_router.put("/reminders/{reminder_id}/complete")
 async def complete_reminder(reminder_id: str, user_id: str = Depends(get_current_user)):
@@ -1165,7 +1417,7 @@ async def delete_reminder(reminder_id: str, user_id: str = Depends(get_current_u
     # Soft delete
     result = await db.reminders.update_one(
         {"id": reminder_id, "user_id": user_id, "is_deleted": {"$ne": True}},
-        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}}
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Reminder not found")
@@ -1176,13 +1428,13 @@ async def delete_reminder(reminder_id: str, user_id: str = Depends(get_current_u
 @api_router.post("/targets", response_model=Target)
 async def create_target(target: TargetCreate, user_id: str = Depends(get_current_user)):
     target_obj = Target(user_id=user_id, **target.model_dump())
-    await db.targets.insert_one(serialize_doc(target_obj.model_dump()))
+    await db.targets.insert_one(target_obj.model_dump())
     return target_obj
 
-@api_router.get("/targets", response_model=List[Target])
+@api_router.get("/targets")
 async def get_targets(user_id: str = Depends(get_current_user)):
-    targets = await db.targets.find({"user_id": user_id}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(t) for t in targets]
+    cursor = db.targets.find({"user_id": user_id}, {"_id": 0}).limit(1000)
+    return StreamingResponse(_stream_json_array(cursor), media_type="application/json")
 
 @api_router.put("/targets/{target_id}/progress")
 async def update_target_progress(target_id: str, current_value: int, user_id: str = Depends(get_current_user)):
@@ -1206,20 +1458,20 @@ async def delete_target(target_id: str, user_id: str = Depends(get_current_user)
 @api_router.post("/systems", response_model=System)
 async def create_system(system: SystemCreate, user_id: str = Depends(get_current_user)):
     system_obj = System(user_id=user_id, **system.model_dump())
-    await db.systems.insert_one(serialize_doc(system_obj.model_dump()))
+    await db.systems.insert_one(system_obj.model_dump())
     return system_obj
 
-@api_router.get("/systems", response_model=List[System])
+@api_router.get("/systems")
 async def get_systems(user_id: str = Depends(get_current_user)):
-    systems = await db.systems.find({"user_id": user_id}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(s) for s in systems]
+    cursor = db.systems.find({"user_id": user_id}, {"_id": 0}).limit(1000)
+    return StreamingResponse(_stream_json_array(cursor), media_type="application/json")
 
 @api_router.put("/systems/{system_id}/execute")
 async def execute_system(system_id: str, user_id: str = Depends(get_current_user)):
     """Mark system as executed"""
     result = await db.systems.update_one(
         {"id": system_id, "user_id": user_id},
-        {"$set": {"last_executed": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"last_executed": datetime.now(timezone.utc)}}
     )
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="System not found")
@@ -1282,22 +1534,23 @@ async def generate_resume(request: ResumeGenerateRequest, user_id: str = Depends
 async def tailor_resume_with_ai(request: ResumeGenerateRequest, user_id: str = Depends(get_current_user)):
     """Use AI to tailor resume for specific job"""
     
-    # Get user profile
-    user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
+    # Overlap the independent lookups instead of paying three round-trips
+    lookups = [
+        db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0}),
+        _get_llm_config(user_id),
+    ]
+    if request.job_id:
+        lookups.append(db.jobs.find_one({"id": request.job_id, "user_id": user_id}, {"_id": 0}))
+    results = await asyncio.gather(*lookups)
+    user, llm_config = results[0], results[1]
+    job = results[2] if request.job_id else None
+    
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # Get user's LLM config
-    llm_config = await db.llm_configs.find_one({"user_id": user_id})
-    
     if not llm_config:
         raise HTTPException(status_code=400, detail="Please configure your LLM settings first")
     
-    # Get job details
-    job = None
-    if request.job_id:
-        job = await db.jobs.find_one({"id": request.job_id, "user_id": user_id}, {"_id": 0})
-    
     if not job or not job.get("description"):
         raise HTTPException(status_code=400, detail="Job description is required for AI tailoring")
     
@@ -1319,18 +1572,8 @@ Description: {job.get('description', '')[:1000]}
 """
         
         # Call AI
-        model_name = llm_config['model']
-        if llm_config['provider'] == 'openai_compatible':
-            model_prefix = "openai/"
-        elif llm_config['provider'] == 'openrouter':
-            model_prefix = "openrouter/"
-            if '/' not in model_name:
-                model_name = f"openai/{model_name}"
-        else:
-            model_prefix = f"{llm_config['provider']}/"
-        
         response = await acompletion(
-            model=f"{model_prefix}{model_name}",
+            model=_resolve_model(llm_config['provider'], llm_config['model']),
             messages=[
                 {"role": "system", "content": "You are a professional resume writer. Provide specific, actionable suggestions to tailor a resume for a job. Be concise and focus on impact."},
                 {"role": "user", "content": f"User Profile:\n{user_context}\n\nTarget Job:\n{job_context}\n\nProvide 5 specific suggestions to tailor this resume for maximum impact. Focus on: 1) Which skills to emphasize 2) How to reframe experience 3) Keywords to include 4) Projects to highlight 5) Summary adjustments"}
@@ -1353,6 +1596,34 @@ Description: {job.get('description', '')[:1000]}
         logger.error(f"Resume tailoring error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"AI tailoring error: {str(e)}")
 
+# Token budget for the resume excerpt sent to the parsing LLM. Clipping on
+# token count instead of a character slice spends the whole budget on real
+# content rather than whitespace-heavy PDF extractions.
+_RESUME_TOKEN_BUDGET = 3000
+_tiktoken_encoding = None
+
+# Fields where the AI-parsed value beats the rule-based one even when set
+_AI_OVERRIDE_FIELDS = frozenset(('summary', 'projects'))
+
+def _token_encoding():
+    global _tiktoken_encoding
+    if _tiktoken_encoding is None:
+        try:
+            import tiktoken
+            _tiktoken_encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:  # missing package or unreachable BPE download
+            _tiktoken_encoding = False
+    return _tiktoken_encoding or None
+
+def _clip_resume_text(text: str) -> str:
+    encoding = _token_encoding()
+    if encoding is None:
+        return text[:4 * _RESUME_TOKEN_BUDGET]
+    tokens = encoding.encode(text)
+    if len(tokens) <= _RESUME_TOKEN_BUDGET:
+        return text
+    return encoding.decode(tokens[:_RESUME_TOKEN_BUDGET])
+
 @api_router.post("/resume/upload")
 async def upload_resume(file: UploadFile = File(...), user_id: str = Depends(get_current_user)):
     """Upload resume file (PDF or DOCX) and parse it with AI"""
@@ -1366,61 +1637,52 @@ async def upload_resume(file: UploadFile = File(...), user_id: str = Depends(get
         # Read file
         file_bytes = await file.read()
         
-        # Extract text based on file type
-        if file.content_type == 'application/pdf':
-            resume_text = extract_text_from_pdf(file_bytes)
-        else:  # DOCX
-            resume_text = extract_text_from_docx(file_bytes)
+        # Extraction is CPU-bound, so run it in a worker thread and overlap
+        # it with the LLM-config lookup instead of stalling the event loop
+        extract = (extract_text_from_pdf if file.content_type == 'application/pdf'
+                   else extract_text_from_docx)
+        resume_text, llm_config = await asyncio.gather(
+            asyncio.to_thread(extract, file_bytes),
+            _get_llm_config(user_id),
+        )
         
         if not resume_text:
             raise HTTPException(status_code=400, detail="Could not extract text from file")
         
-        # Parse with rule-based parser first
-        parsed_data = parse_resume_with_ai(resume_text)
-        
-        # Get user's LLM config for enhanced parsing
-        llm_config = await db.llm_configs.find_one({"user_id": user_id})
-        
+        # Start the LLM call first, then run the rule-based parse in a
+        # worker thread while the network request is in flight; the parse
+        # time disappears into the LLM latency instead of adding to it
+        ai_task = None
         if llm_config:
+            ai_task = asyncio.create_task(acompletion(
+                model=_resolve_model(llm_config['provider'], llm_config['model']),
+                messages=[
+                    {"role": "system", "content": "You are a resume parser. Extract structured data from resumes. Respond ONLY with valid JSON, no markdown or extra text."},
+                    {"role": "user", "content": f"Parse this resume and return JSON with fields: name, email, phone, location, summary (2-3 sentences), skills (array), years_of_experience (number), education (array), projects (array of project descriptions), work_authorization. Resume text:\n\n{_clip_resume_text(resume_text)}"}
+                ],
+                api_key=llm_config.get('api_key') or 'dummy',
+                base_url=llm_config.get('base_url'),
+                # JSON mode guarantees parseable output, so no
+                # markdown-fence stripping or reparse retries
+                response_format={"type": "json_object"}
+            ))
+
+        parsed_data = await asyncio.to_thread(parse_resume_with_ai, resume_text)
+
+        if ai_task is not None:
             try:
-                # Use AI for better parsing
-                model_name = llm_config['model']
-                if llm_config['provider'] == 'openai_compatible':
-                    model_prefix = "openai/"
-                elif llm_config['provider'] == 'openrouter':
-                    model_prefix = "openrouter/"
-                    if '/' not in model_name:
-                        model_name = f"openai/{model_name}"
-                else:
-                    model_prefix = f"{llm_config['provider']}/"
-                
-                response = await acompletion(
-                    model=f"{model_prefix}{model_name}",
-                    messages=[
-                        {"role": "system", "content": "You are a resume parser. Extract structured data from resumes. Respond ONLY with valid JSON, no markdown or extra text."},
-                        {"role": "user", "content": f"Parse this resume and return JSON with fields: name, email, phone, location, summary (2-3 sentences), skills (array), years_of_experience (number), education (array), projects (array of project descriptions), work_authorization. Resume text:\n\n{resume_text[:3000]}"}
-                    ],
-                    api_key=llm_config.get('api_key') or 'dummy',
-                    base_url=llm_config.get('base_url')
-                )
-                
-                ai_response = response.choices[0].message.content
-                
-                # Try to parse AI response as JSON
-                import json
-                # Remove markdown code blocks if present
-                ai_response = ai_response.replace('```json', '').replace('```', '').strip()
-                ai_parsed = json.loads(ai_response)
-                
+                response = await ai_task
+                ai_parsed = _loads(response.choices[0].message.content)
+
                 # Merge AI results with rule-based results (AI takes precedence)
-                for key in ai_parsed:
-                    if ai_parsed[key] and (not parsed_data.get(key) or key in ['summary', 'projects']):
-                        parsed_data[key] = ai_parsed[key]
-                
+                for key, value in ai_parsed.items():
+                    if value and (key in _AI_OVERRIDE_FIELDS or not parsed_data.get(key)):
+                        parsed_data[key] = value
+
             except Exception as e:
                 logger.warning(f"AI parsing failed, using rule-based: {e}")
                 # Continue with rule-based parsing
-        
+
         return {
             "success": True,
             "parsed_data": parsed_data,
@@ -1448,45 +1710,43 @@ async def get_trash(user_id: str = Depends(get_current_user)):
         "reminders": []
     }
     
-    # Get deleted jobs
-    jobs = await db.jobs.find({"user_id": user_id, "is_deleted": True}, {"_id": 0}).to_list(100)
-    deleted_items["jobs"] = [{"id": j["id"], "title": j["title"], "company": j["company"], "deleted_at": j.get("deleted_at"), "type": "job"} for j in jobs]
-    
-    # Get deleted companies
-    companies = await db.companies.find({"user_id": user_id, "is_deleted": True}, {"_id": 0}).to_list(100)
-    deleted_items["companies"] = [{"id": c["id"], "name": c["name"], "deleted_at": c.get("deleted_at"), "type": "company"} for c in companies]
-    
-    # Get deleted contacts
-    contacts = await db.contacts.find({"user_id": user_id, "is_deleted": True}, {"_id": 0}).to_list(100)
-    deleted_items["contacts"] = [{"id": c["id"], "name": c["name"], "deleted_at": c.get("deleted_at"), "type": "contact"} for c in contacts]
-    
-    # Get deleted todos
-    todos = await db.todos.find({"user_id": user_id, "is_deleted": True}, {"_id": 0}).to_list(100)
-    deleted_items["todos"] = [{"id": t["id"], "title": t["title"], "deleted_at": t.get("deleted_at"), "type": "todo"} for t in todos]
-    
-    # Get deleted knowledge
-    knowledge = await db.knowledge.find({"user_id": user_id, "is_deleted": True}, {"_id": 0}).to_list(100)
-    deleted_items["knowledge"] = [{"id": k["id"], "title": k["title"], "deleted_at": k.get("deleted_at"), "type": "knowledge"} for k in knowledge]
-    
-    # Get deleted reminders
-    reminders = await db.reminders.find({"user_id": user_id, "is_deleted": True}, {"_id": 0}).to_list(100)
-    deleted_items["reminders"] = [{"id": r["id"], "message": r["message"], "deleted_at": r.get("deleted_at"), "type": "reminder"} for r in reminders]
-    
+    # One aggregation returns every trash list in a single round trip:
+    # each collection contributes a slim, typed projection via $unionWith,
+    # so the server does one indexed scan per collection and the client
+    # just buckets the combined stream by type
+    trash_query = {"user_id": user_id, "is_deleted": True}
+
+    def _branch(fields: dict, type_name: str) -> list:
+        return [
+            {"$match": trash_query},
+            {"$limit": 100},
+            {"$project": {
+                "_id": 0, "id": 1,
+                "deleted_at": {"$ifNull": ["$deleted_at", None]},
+                "type": {"$literal": type_name},
+                **fields,
+            }},
+        ]
+
+    pipeline = _branch({"title": 1, "company": 1}, "job") + [
+        {"$unionWith": {"coll": "companies", "pipeline": _branch({"name": 1}, "company")}},
+        {"$unionWith": {"coll": "contacts", "pipeline": _branch({"name": 1}, "contact")}},
+        {"$unionWith": {"coll": "todos", "pipeline": _branch({"title": 1}, "todo")}},
+        {"$unionWith": {"coll": "knowledge", "pipeline": _branch({"title": 1}, "knowledge")}},
+        {"$unionWith": {"coll": "reminders", "pipeline": _branch({"message": 1}, "reminder")}},
+    ]
+
+    bucket_by_type = {"job": "jobs", "company": "companies", "contact": "contacts",
+                      "todo": "todos", "knowledge": "knowledge", "reminder": "reminders"}
+    async for doc in db.jobs.aggregate(pipeline):
+        deleted_items[bucket_by_type[doc["type"]]].append(doc)
+
     return deleted_items
 
 @api_router.post("/trash/restore/{item_type}/{item_id}")
 async def restore_item(item_type: str, item_id: str, user_id: str = Depends(get_current_user)):
     """Restore a soft-deleted item"""
-    collection_map = {
-        "job": "jobs",
-        "company": "companies",
-        "contact": "contacts",
-        "todo": "todos",
-        "knowledge": "knowledge",
-        "reminder": "reminders"
-    }
-    
-    collection_name = collection_map.get(item_type)
+    collection_name = _TRASH_COLL_MAP.get(item_type)
     if not collection_name:
         raise HTTPException(status_code=400, detail="Invalid item type")
     
@@ -1498,22 +1758,15 @@ async def restore_item(item_type: str, item_id: str, user_id: str = Depends(get_
     
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail=f"{item_type.title()} not found in trash")
-    
+
+    if collection_name == "knowledge":
+        _bump_kb_version(user_id)
     return {"message": f"{item_type.title()} restored successfully"}
 
 @api_router.delete("/trash/{item_type}/{item_id}")
 async def permanently_delete_item(item_type: str, item_id: str, user_id: str = Depends(get_current_user)):
     """Permanently delete an item from trash"""
-    collection_map = {
-        "job": "jobs",
-        "company": "companies",
-        "contact": "contacts",
-        "todo": "todos",
-        "knowledge": "knowledge",
-        "reminder": "reminders"
-    }
-    
-    collection_name = collection_map.get(item_type)
+    collection_name = _TRASH_COLL_MAP.get(item_type)
     if not collection_name:
         raise HTTPException(status_code=400, detail="Invalid item type")
     
@@ -1525,36 +1778,79 @@ async def permanently_delete_item(item_type: str, item_id: str, user_id: str = D
     
     return {"message": f"{item_type.title()} permanently deleted"}
 
+# Maps the item type in trash URLs/payloads to its collection; module level
+# so handlers do not rebuild the dict per request
+_TRASH_COLL_MAP = {
+    "job": "jobs",
+    "company": "companies",
+    "contact": "contacts",
+    "todo": "todos",
+    "knowledge": "knowledge",
+    "reminder": "reminders"
+}
+
+class TrashItemRef(BaseModel):
+    type: str
+    id: str
+
+class TrashBulkRequest(BaseModel):
+    items: List[TrashItemRef]
+
+def _group_trash_ids(items: List[TrashItemRef]) -> dict:
+    """Group requested ids by collection, rejecting unknown types"""
+    ids_by_collection: dict = {}
+    for item in items:
+        collection_name = _TRASH_COLL_MAP.get(item.type)
+        if not collection_name:
+            raise HTTPException(status_code=400, detail=f"Invalid item type: {item.type}")
+        ids_by_collection.setdefault(collection_name, []).append(item.id)
+    return ids_by_collection
+
+@api_router.post("/trash/restore-bulk")
+async def restore_items_bulk(request: TrashBulkRequest, user_id: str = Depends(get_current_user)):
+    """Restore many soft-deleted items in one round trip per collection"""
+    ids_by_collection = _group_trash_ids(request.items)
+    results = await asyncio.gather(*[
+        db[name].update_many(
+            {"user_id": user_id, "id": {"$in": ids}, "is_deleted": True},
+            {"$set": {"is_deleted": False, "deleted_at": None}}
+        )
+        for name, ids in ids_by_collection.items()
+    ])
+    if "knowledge" in ids_by_collection:
+        _bump_kb_version(user_id)
+    return {"restored": sum(result.modified_count for result in results)}
+
+@api_router.delete("/trash/bulk")
+async def permanently_delete_items_bulk(request: TrashBulkRequest, user_id: str = Depends(get_current_user)):
+    """Permanently delete many trash items in one round trip per collection"""
+    ids_by_collection = _group_trash_ids(request.items)
+    results = await asyncio.gather(*[
+        db[name].delete_many(
+            {"user_id": user_id, "id": {"$in": ids}, "is_deleted": True})
+        for name, ids in ids_by_collection.items()
+    ])
+    return {"deleted": sum(result.deleted_count for result in results)}
+
 @api_router.delete("/trash/empty")
 async def empty_trash(user_id: str = Depends(get_current_user)):
     """Empty all trash for the user"""
     collections = ["jobs", "companies", "contacts", "todos", "knowledge", "reminders"]
-    
-    total_deleted = 0
-    for coll_name in collections:
-        collection = db[coll_name]
-        result = await collection.delete_many({"user_id": user_id, "is_deleted": True})
-        total_deleted += result.deleted_count
-    
+
+    # Delete from all six collections concurrently instead of serially
+    results = await asyncio.gather(*[
+        db[coll_name].delete_many({"user_id": user_id, "is_deleted": True})
+        for coll_name in collections
+    ])
+    total_deleted = sum(result.deleted_count for result in results)
+
     return {"message": f"Permanently deleted {total_deleted} items"}
 
 # ============ ANALYTICS ROUTES ============
 
 @api_router.get("/analytics/dashboard")
 async def get_dashboard_analytics(user_id: str = Depends(get_current_user)):
-    jobs = await db.jobs.find({"user_id": user_id}, {"_id": 0}).to_list(1000)
-    
-    stats = {
-        "total": len(jobs),
-        "applied": len([j for j in jobs if j['status'] == 'applied']),
-        "interview": len([j for j in jobs if j['status'] == 'interview']),
-        "offer": len([j for j in jobs if j['status'] == 'offer']),
-        "rejected": len([j for j in jobs if j['status'] == 'rejected']),
-        "ghosted": len([j for j in jobs if j['status'] == 'ghosted']),
-        "pending": len([j for j in jobs if j['status'] == 'pending'])
-    }
-    
-    return stats
+    return await _job_status_stats(user_id)
 
 # ============ AI-POWERED FEATURES ROUTES ============
 
@@ -1577,29 +1873,56 @@ class SearchJobsRequest(BaseModel):
 class KnowledgeSearchRequest(BaseModel):
     query: str
 
+# Content-hash cache for the rule-based description parser: interview prep,
+# learning paths and repeated pastes all reparse identical text, so repeats
+# are served from memory keyed by a digest rather than the full string
+_PARSE_CACHE_MAX = 1024
+_parse_cache: dict = {}
+
+def _parse_description_cached(description: str) -> dict:
+    key = hashlib.blake2b(description.encode(), digest_size=16).digest()
+    cached = _parse_cache.get(key)
+    if cached is not None:
+        return cached
+    parsed = parse_job_description(description)
+    if len(_parse_cache) >= _PARSE_CACHE_MAX:
+        _parse_cache.pop(next(iter(_parse_cache)))
+    _parse_cache[key] = parsed
+    return parsed
+
 @api_router.post("/ai/parse-job-description")
 async def parse_job_desc(request: JobDescriptionParse, user_id: str = Depends(get_current_user)):
     """Parse job description to extract skills, requirements, etc."""
     try:
-        result = parse_job_description(request.description)
+        result = _parse_description_cached(request.description)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Interview questions and learning paths are pure functions of the job
+# title and skill list (the rule-based generators never read the raw
+# description text), so repeat views are served straight from an LRU.
+# Keys keep the original skill order because both outputs depend on it.
+@lru_cache(maxsize=512)
+def _interview_questions_cached(job_title: str, skills: tuple) -> list:
+    return generate_interview_questions(job_title, '', list(skills))
+
+@lru_cache(maxsize=512)
+def _learning_path_cached(skills: tuple) -> dict:
+    return extract_learning_path(list(skills))
+
 @api_router.post("/ai/interview-prep")
 async def get_interview_prep(request: InterviewPrepRequest, user_id: str = Depends(get_current_user)):
     """Generate interview preparation questions for a job"""
     try:
-        job = await db.jobs.find_one({"id": request.job_id, "user_id": user_id})
+        job = await db.jobs.find_one(
+            {"id": request.job_id, "user_id": user_id},
+            {"_id": 0, "title": 1, "company": 1, "description": 1})
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
         
-        parsed = parse_job_description(job.get('description', ''))
-        questions = generate_interview_questions(
-            job['title'],
-            job.get('description', ''),
-            parsed['skills']
-        )
+        parsed = _parse_description_cached(job.get('description', ''))
+        questions = _interview_questions_cached(job['title'], tuple(parsed['skills']))
         
         return {
             "job_title": job['title'],
@@ -1643,11 +1966,24 @@ async def search_jobs_endpoint(request: SearchJobsRequest, user_id: str = Depend
 async def knowledge_search(request: KnowledgeSearchRequest, user_id: str = Depends(get_current_user)):
     """Semantic search in knowledge base"""
     try:
-        knowledge_items = await db.knowledge.find({"user_id": user_id}, {"_id": 0}).to_list(1000)
+        version = _kb_versions.get(user_id, 0)
+        cached = _kb_cache.get(user_id)
+        if cached is not None and cached[0] == version:
+            knowledge_items = cached[1]
+        else:
+            knowledge_items = await db.knowledge.find(
+                {"user_id": user_id, "is_deleted": {"$ne": True}},
+                {"_id": 0, "id": 1, "title": 1, "content": 1, "tags": 1, "embedding": 1},
+            ).to_list(1000)
+            if len(_kb_cache) >= _KB_CACHE_MAX:
+                _kb_cache.pop(next(iter(_kb_cache)))
+            _kb_cache[user_id] = (version, knowledge_items)
         if not knowledge_items:
             return []
         
-        results = search_knowledge_by_embedding(request.query, knowledge_items)
+        # Encoding the query is CPU-bound; keep it off the event loop
+        results = await asyncio.to_thread(
+            search_knowledge_by_embedding, request.query, knowledge_items)
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1656,12 +1992,14 @@ async def knowledge_search(request: KnowledgeSearchRequest, user_id: str = Depen
 async def get_learning_path(job_id: str, user_id: str = Depends(get_current_user)):
     """Get learning path for a specific job"""
     try:
-        job = await db.jobs.find_one({"id": job_id, "user_id": user_id})
+        job = await db.jobs.find_one(
+            {"id": job_id, "user_id": user_id},
+            {"_id": 0, "title": 1, "company": 1, "description": 1})
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
         
-        parsed = parse_job_description(job.get('description', ''))
-        learning_path = extract_learning_path(parsed['skills'])
+        parsed = _parse_description_cached(job.get('description', ''))
+        learning_path = _learning_path_cached(tuple(parsed['skills']))
         
         return {
             "job_title": job['title'],
@@ -1681,6 +2019,10 @@ async def root():
 
 app.include_router(api_router)
 
+# JSON list payloads (trash, analytics, knowledge search) compress 5-10x;
+# small bodies skip compression entirely via minimum_size
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -1689,6 +2031,65 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def warm_embedding_model():
+    # Kick off model load + warmup in the background so the first
+    # knowledge search doesn't eat the cold-start latency
+    preload_embedding_model()
+
+@app.on_event("startup")
+async def warmup():
+    # Run the rule-based parsers once on dummy input so lazily-built regex
+    # caches and keyword automata are primed, and ping Mongo so the first
+    # real request doesn't pay connection setup. Failures must not block boot.
+    try:
+        await asyncio.to_thread(parse_job_description, "warmup")
+        await asyncio.to_thread(parse_resume_with_ai, "warmup")
+        await db.command("ping")
+    except Exception as e:
+        logger.warning(f"Startup warmup failed: {e}")
+
+@app.on_event("startup")
+async def ensure_indexes():
+    # Every list route filters on (user_id, is_deleted) and every item route
+    # looks up by id; declare the matching indexes so these are index seeks
+    # instead of collection scans. create_index is a no-op when it exists.
+    for collection in (db.jobs, db.companies, db.contacts, db.todos,
+                       db.reminders, db.knowledge, db.chat_messages):
+        await collection.create_index([("user_id", 1), ("is_deleted", 1)])
+    await db.companies.create_index([("user_id", 1), ("name_lower", 1)])
+    # Covers the dashboard $group so status counts never touch documents
+    await db.jobs.create_index([("user_id", 1), ("status", 1)])
+    # get_upcoming_reminders filters equality -> range -> sort on these fields
+    await db.reminders.create_index(
+        [("user_id", 1), ("is_deleted", 1), ("completed", 1), ("reminder_date", 1)])
+    # chat history filters by session and sorts by timestamp
+    await db.chat_messages.create_index(
+        [("user_id", 1), ("session_id", 1), ("timestamp", 1)])
+    for collection in (db.prompts, db.portals, db.targets, db.systems, db.llm_configs):
+        await collection.create_index([("user_id", 1)])
+    for collection in (db.jobs, db.companies, db.contacts, db.todos,
+                       db.reminders, db.knowledge):
+        await collection.create_index([("id", 1)], unique=True)
+    await db.users.create_index([("email", 1)], unique=True)
+    await db.users.create_index([("id", 1)], unique=True)
+    # Trash endpoints only touch the deleted subset; partial indexes keep
+    # those scans O(trash size) no matter how many live docs a user has
+    for collection in (db.jobs, db.companies, db.contacts, db.todos,
+                       db.knowledge, db.reminders):
+        await collection.create_index(
+            [("user_id", 1), ("deleted_at", -1)],
+            partialFilterExpression={"is_deleted": True},
+            name="trash_idx")
+    # TTL indexes: trashed rows expire 30 days after deletion and chat
+    # messages after 90 days, so the working set (and every is_deleted
+    # index these queries traverse) stays small without manual cleanup.
+    # deleted_at is None on live docs, which TTL indexes ignore.
+    for collection in (db.todos, db.reminders, db.knowledge):
+        await collection.create_index("deleted_at", expireAfterSeconds=30 * 86400)
+    await db.chat_messages.create_index("timestamp", expireAfterSeconds=90 * 86400)
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await litellm.aclient_session.aclose()
     client.close()
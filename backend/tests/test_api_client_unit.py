@@ -0,0 +1,118 @@
+"""
+Unit tier for the backend_test.py API client: exercises status handling,
+header assembly and the token flow in CareerFlowAPITester.run_test against
+an in-process httpx.MockTransport — no network, no preview-server warm-up,
+fully deterministic. The live remote suite stays in backend_test.py.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# backend_test.py lives at the repo root, one level above backend/
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from backend_test import CareerFlowAPITester
+
+
+def _make_tester(handler, token=None):
+    tester = CareerFlowAPITester()
+    tester.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    if token:
+        tester.set_token(token)
+    return tester
+
+
+async def _run_one(handler, *args, token=None, **kwargs):
+    tester = _make_tester(handler, token=token)
+    async with tester.client:
+        result = await tester.run_test(*args, **kwargs)
+    return tester, result
+
+
+class TestRunTestStatusHandling:
+
+    def test_expected_status_passes(self):
+        def handler(request):
+            return httpx.Response(200, json={"ok": True})
+
+        tester, (success, data) = asyncio.run(
+            _run_one(handler, "expected 200", "GET", "jobs", 200))
+        assert success is True
+        assert data == {"ok": True}
+        assert tester.tests_passed == 1
+
+    def test_unexpected_status_fails(self):
+        def handler(request):
+            return httpx.Response(500, json={"detail": "boom"})
+
+        tester, (success, data) = asyncio.run(
+            _run_one(handler, "expected 200, got 500", "GET", "jobs", 200))
+        assert success is False
+        assert tester.tests_passed == 0
+        assert tester.test_results[-1]["error"] is not None
+
+    def test_non_json_body_falls_back_to_raw(self):
+        def handler(request):
+            return httpx.Response(200, text="not json")
+
+        _, (success, data) = asyncio.run(
+            _run_one(handler, "raw body", "GET", "jobs", 200))
+        assert success is True
+        assert data == {"raw_response": "not json"}
+
+
+class TestRunTestHeaderAssembly:
+
+    def test_get_sends_auth_but_no_content_type(self):
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(200, json=[])
+
+        asyncio.run(_run_one(handler, "get headers", "GET", "jobs", 200,
+                             token="tok123"))
+        assert seen.get("authorization") == "Bearer tok123"
+        assert "content-type" not in seen
+
+    def test_post_sends_json_content_type(self):
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(200, json={"id": "x"})
+
+        asyncio.run(_run_one(handler, "post headers", "POST", "jobs", 200,
+                             data={"title": "t"}, token="tok123"))
+        assert seen.get("content-type") == "application/json"
+        assert seen.get("authorization") == "Bearer tok123"
+
+
+class TestTokenFlow:
+
+    def test_login_stores_token_and_reuses_it(self):
+        seen_auth = []
+
+        def handler(request):
+            if request.url.path.endswith("/auth/login"):
+                return httpx.Response(200, json={"access_token": "fresh-token"})
+            seen_auth.append(request.headers.get("authorization"))
+            return httpx.Response(200, json={"id": "u1"})
+
+        async def _flow():
+            tester = _make_tester(handler)
+            async with tester.client:
+                await tester.test_auth_endpoints()
+            return tester
+
+        tester = asyncio.run(_flow())
+        assert tester.token == "fresh-token"
+        assert "Bearer fresh-token" in seen_auth
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-p", "no:cacheprovider", "--disable-warnings"])
@@ -0,0 +1,64 @@
+"""
+Unit tests for the scraper SSRF guard (scrapers.validate_url).
+No network: DNS resolution is mocked at the socket layer.
+"""
+
+import asyncio
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import scrapers
+
+
+@pytest.fixture(scope="module")
+def event_loop():
+    """One event loop shared by every coroutine in the module, instead of
+    a fresh new_event_loop()/close() pair per test"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_dns_cache():
+    """validate_url caches resolutions; keep cases independent"""
+    scrapers._dns_cache.clear()
+
+
+@pytest.fixture
+def mock_getaddrinfo(monkeypatch):
+    """Point DNS at a canned address; cheaper per call than
+    unittest.mock.patch's target-walking context manager"""
+    def _setter(ip):
+        monkeypatch.setattr(socket, "getaddrinfo", lambda *a, **kw: [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, '', (ip, 80))])
+    return _setter
+
+
+def test_validate_url_rejects_non_http_scheme(event_loop):
+    result = event_loop.run_until_complete(scrapers.validate_url("ftp://example.com/file"))
+    assert result is False
+
+
+@pytest.mark.parametrize("ip, url, expected", [
+    ("127.0.0.1",   "http://localhost",        False),
+    ("8.8.8.8",     "http://google.com",       True),
+    ("192.168.1.1", "http://intranet.local",   False),
+    ("10.0.0.1",    "http://corp.internal",    False),
+    ("172.16.0.1",  "http://vpn.internal",     False),
+    ("169.254.1.1", "http://linklocal.test",   False),
+    ("100.64.0.1",  "http://cgnat.test",       False),
+])
+def test_validate_url_resolution(event_loop, mock_getaddrinfo, ip, url, expected):
+    mock_getaddrinfo(ip)
+    result = event_loop.run_until_complete(scrapers.validate_url(url))
+    assert result is expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-p", "no:cacheprovider", "--disable-warnings"])